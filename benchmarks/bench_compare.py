@@ -0,0 +1,49 @@
+"""Benchmark comparing and hashing versions.
+
+Run with ``python benchmarks/bench_compare.py [--count N]``.
+"""
+
+import time
+from operator import attrgetter
+
+from common import argument_parser, corpus
+
+from parver import Version
+
+
+def main() -> None:
+    parser = argument_parser(100_000)
+    args = parser.parse_args()
+
+    versions = [Version.parse(s) for s in corpus(args.count)]
+
+    start = time.perf_counter()
+    sorted(versions)
+    elapsed = time.perf_counter() - start
+    print(f"      sorted: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    sorted(versions, key=attrgetter("sort_key"))
+    elapsed = time.perf_counter() - start
+    print(f" by sort_key: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    unique = set(versions)
+    elapsed = time.perf_counter() - start
+    print(f"   build set: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    for version in versions:
+        version in unique
+    elapsed = time.perf_counter() - start
+    print(f"  set lookup: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    for version in versions:
+        version == version
+    elapsed = time.perf_counter() - start
+    print(f"self compare: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
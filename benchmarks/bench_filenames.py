@@ -0,0 +1,59 @@
+"""Benchmark extracting versions from distribution filenames.
+
+Run with ``python benchmarks/bench_filenames.py [--count N]``.
+"""
+
+import random
+import time
+
+from common import argument_parser
+
+from parver import Version, versions_from_filenames
+
+
+def corpus(count: int) -> list[str]:
+    rng = random.Random(0)
+    names = ["pkg", "some_project", "numpy", "my_lib"]
+    suffixes = [
+        "-py3-none-any.whl",
+        "-1-cp312-cp312-manylinux_2_17_x86_64.whl",
+        ".tar.gz",
+        ".zip",
+    ]
+    filenames = []
+    for _ in range(count):
+        release = ".".join(str(rng.randrange(20)) for _ in range(rng.randint(1, 4)))
+        extra = rng.choice(["", "", "rc1", ".post2", ".dev3", "+cpu"])
+        filenames.append(f"{rng.choice(names)}-{release}{extra}{rng.choice(suffixes)}")
+    return filenames
+
+
+def split_then_parse(filenames: list[str]) -> None:
+    for filename in filenames:
+        if filename.endswith(".whl"):
+            version = filename.split("-")[1]
+        else:
+            stem = filename.removesuffix(".tar.gz").removesuffix(".zip")
+            version = stem.rpartition("-")[2]
+        Version.parse(version)
+
+
+def batch(filenames: list[str]) -> None:
+    for _ in versions_from_filenames(filenames):
+        pass
+
+
+def main() -> None:
+    parser = argument_parser(1_000_000)
+    args = parser.parse_args()
+
+    filenames = corpus(args.count)
+    for func in [split_then_parse, batch]:
+        start = time.perf_counter()
+        func(filenames)
+        elapsed = time.perf_counter() - start
+        print(f"{func.__name__:>20}: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark matching many version ranges against many versions.
+
+Run with ``python benchmarks/bench_index.py [--count N]``.
+"""
+
+import random
+import time
+
+from common import argument_parser, corpus
+
+from parver import RangeIndex, Version, VersionIndex, VersionRange
+
+
+def main() -> None:
+    parser = argument_parser(10_000)
+    parser.add_argument("--scan-count", type=int, default=100)
+    args = parser.parse_args()
+
+    versions = [Version.parse(s) for s in corpus(args.count)]
+    rng = random.Random(1)
+    ranges = [sorted(rng.sample(versions, 2)) for _ in range(args.count)]
+
+    start = time.perf_counter()
+    for lower, upper in ranges[: args.scan_count]:
+        [v for v in versions if lower <= v < upper]
+    elapsed = time.perf_counter() - start
+    estimate = elapsed * len(ranges) / args.scan_count
+    print(
+        f"   scan versions: {estimate:.2f}s (estimated from {args.scan_count} ranges)"
+    )
+
+    start = time.perf_counter()
+    index = VersionIndex(versions)
+    elapsed = time.perf_counter() - start
+    print(f"   version index: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    spans = [index.span(lower, upper) for lower, upper in ranges]
+    elapsed = time.perf_counter() - start
+    print(f"           spans: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    for span in spans:
+        index.versions[span.start : span.stop]
+    elapsed = time.perf_counter() - start
+    print(f"         matches: {elapsed:.2f}s")
+
+    version_ranges = [VersionRange(lower, upper) for lower, upper in ranges]
+
+    start = time.perf_counter()
+    for version in versions[: args.scan_count]:
+        [r for r in version_ranges if version in r]
+    elapsed = time.perf_counter() - start
+    estimate = elapsed * len(versions) / args.scan_count
+    print(
+        f"     scan ranges: {estimate:.2f}s (estimated from {args.scan_count} versions)"
+    )
+
+    start = time.perf_counter()
+    range_index = RangeIndex(version_ranges)
+    elapsed = time.perf_counter() - start
+    print(f"     range index: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    for version in versions:
+        range_index.containing(version)
+    elapsed = time.perf_counter() - start
+    print(f"      containing: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
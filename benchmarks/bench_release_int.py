@@ -0,0 +1,45 @@
+"""Benchmark versions with zero-padded numbers, which use ReleaseInt.
+
+Run with ``python benchmarks/bench_release_int.py [--count N]``.
+"""
+
+import random
+import time
+import tracemalloc
+
+from common import argument_parser
+
+from parver import Version
+
+
+def corpus(count: int) -> list[str]:
+    rng = random.Random(0)
+    return [
+        f"{rng.randint(2020, 2026)}.{rng.randint(1, 12):02}.{rng.randint(1, 28):02}"
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argument_parser(100_000)
+    args = parser.parse_args()
+
+    strings = corpus(args.count)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    versions = [Version.parse(s) for s in strings]
+    elapsed = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"parse: {elapsed:.2f}s, {memory / len(versions):.0f} bytes per version")
+
+    start = time.perf_counter()
+    for version in versions:
+        version.bump_release(index=1).bump_release(index=2)
+    elapsed = time.perf_counter() - start
+    print(f" bump: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark selecting versions by order.
+
+Run with ``python benchmarks/bench_sorting.py [--count N]``.
+"""
+
+import itertools
+import time
+
+from common import argument_parser, corpus
+
+from parver import LargestVersions, Version, latest_by, merge_sorted, nlargest
+
+
+def latest_by_sorting(versions: list[Version]) -> dict[tuple[int, ...], Version]:
+    latest: dict[tuple[int, ...], Version] = {}
+    for version in sorted(versions):
+        if not version.is_prerelease:
+            latest[(*version.release, 0)[:2]] = version
+    return latest
+
+
+def main() -> None:
+    parser = argument_parser(100_000)
+    args = parser.parse_args()
+
+    versions = [Version.parse(s) for s in corpus(args.count)]
+
+    start = time.perf_counter()
+    latest_by_sorting(versions)
+    elapsed = time.perf_counter() - start
+    print(f"latest (sorted): {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    latest_by(versions)
+    elapsed = time.perf_counter() - start
+    print(f"      latest_by: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    sorted(versions)[-10:]
+    elapsed = time.perf_counter() - start
+    print(f"top 10 (sorted): {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    nlargest(10, versions)
+    elapsed = time.perf_counter() - start
+    print(f"       nlargest: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    largest = LargestVersions(10)
+    largest.update(versions)
+    largest.result()
+    elapsed = time.perf_counter() - start
+    print(f"LargestVersions: {elapsed:.2f}s")
+
+    mirrors = [sorted(versions[i::4]) for i in range(4)]
+
+    start = time.perf_counter()
+    sorted(itertools.chain(*mirrors))
+    elapsed = time.perf_counter() - start
+    print(f" merge (sorted): {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    list(merge_sorted(*mirrors))
+    elapsed = time.perf_counter() - start
+    print(f"   merge_sorted: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
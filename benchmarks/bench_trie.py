@@ -0,0 +1,39 @@
+"""Benchmark finding the versions in a release series.
+
+Run with ``python benchmarks/bench_trie.py [--count N]``.
+"""
+
+import time
+
+from common import argument_parser, corpus
+
+from parver import ReleaseTrie, Version
+
+
+def main() -> None:
+    parser = argument_parser(300_000)
+    args = parser.parse_args()
+
+    versions = [Version.parse(s) for s in corpus(args.count, max_major=50)]
+    prefixes = [(major, minor) for major in range(0, 50, 5) for minor in range(10)]
+
+    start = time.perf_counter()
+    trie = ReleaseTrie(versions)
+    elapsed = time.perf_counter() - start
+    print(f"  build: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    for prefix in prefixes:
+        sorted(v for v in versions if (*v.release, 0)[:2] == prefix)
+    elapsed = time.perf_counter() - start
+    print(f"   scan: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    for prefix in prefixes:
+        list(trie.with_prefix(prefix))
+    elapsed = time.perf_counter() - start
+    print(f"   trie: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
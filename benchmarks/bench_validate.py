@@ -0,0 +1,52 @@
+"""Benchmark strict validation of many versions.
+
+Run with ``python benchmarks/bench_validate.py [--count N]``.
+"""
+
+import random
+import time
+
+from common import argument_parser
+
+from parver import ParseError, Version, validate_many
+
+
+def corpus(count: int) -> list[str]:
+    rng = random.Random(0)
+    versions = []
+    for _ in range(count):
+        release = ".".join(str(rng.randrange(20)) for _ in range(rng.randint(1, 4)))
+        extra = rng.choice(["", "", "", "rc1", ".post2", ".dev3", "+cpu"])
+        # roughly one in ten is not in strict form
+        bad = rng.choice(["", "", "", "", "", "", "", "", "", "-beta", ".02"])
+        versions.append(f"{release}{extra}{bad}")
+    return versions
+
+
+def try_except(versions: list[str]) -> None:
+    failures = []
+    for version in versions:
+        try:
+            Version.parse(version, strict=True)
+        except ParseError as exc:
+            failures.append(exc)
+
+
+def batch(versions: list[str]) -> None:
+    validate_many(versions)
+
+
+def main() -> None:
+    parser = argument_parser(100_000)
+    args = parser.parse_args()
+
+    versions = corpus(args.count)
+    for func in [try_except, batch]:
+        start = time.perf_counter()
+        func(versions)
+        elapsed = time.perf_counter() - start
+        print(f"{func.__name__:>10}: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Helpers shared by the benchmarks."""
+
+import argparse
+import random
+
+
+def argument_parser(count: int) -> argparse.ArgumentParser:
+    """Return a parser for the options every benchmark accepts."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=count)
+    return parser
+
+
+def corpus(count: int, *, max_major: int = 5) -> list[str]:
+    """Return `count` random version strings, mostly final releases."""
+    rng = random.Random(0)
+    suffixes = ["", "", "", "a1", "rc2", ".post1", ".dev3", "+local"]
+    return [
+        f"{rng.randint(0, max_major)}.{rng.randint(0, 20)}.{rng.randint(0, 10)}"
+        f"{rng.choice(suffixes)}"
+        for _ in range(count)
+    ]
@@ -1,3 +1,31 @@
+from ._async import aparse_lines
+from ._bump import bump_many
+from ._filename import (
+    InvalidFilenameError,
+    version_from_filename,
+    versions_from_filenames,
+)
+from ._index import RangeIndex, VersionIndex, VersionRange
+from ._scan import VersionMatch, find_versions
+from ._sorting import (
+    LargestVersions,
+    latest_by,
+    merge_sorted,
+    nlargest,
+    nsmallest,
+)
+from ._strict import (
+    RepairResult,
+    RepairRule,
+    StrictCheck,
+    ValidationFailure,
+    ValidationReport,
+    check_strict,
+    repair,
+    repair_many,
+    validate_many,
+)
+from ._trie import ReleaseTrie
 from ._typing import ImplicitZero, Separator
 from ._version import (
     ImplicitNumberError,
@@ -12,25 +40,52 @@ from ._version import (
     StrictSegmentError,
     UnexpectedInputError,
     Version,
+    VersionBuilder,
     VPrefixNotAllowedError,
 )
 
 __all__ = (
     "ImplicitNumberError",
     "ImplicitZero",
+    "InvalidFilenameError",
     "InvalidLocalError",
+    "LargestVersions",
     "LeadingZerosError",
     "LocalEmptyError",
     "NoLeadingNumberError",
     "NonEmptyTuple",
     "ParseError",
+    "RangeIndex",
+    "ReleaseTrie",
+    "RepairResult",
+    "RepairRule",
     "Separator",
+    "StrictCheck",
     "StrictParseError",
     "StrictPreTagError",
     "StrictSegmentError",
     "UnexpectedInputError",
     "VPrefixNotAllowedError",
+    "ValidationFailure",
+    "ValidationReport",
     "Version",
+    "VersionBuilder",
+    "VersionIndex",
+    "VersionMatch",
+    "VersionRange",
+    "aparse_lines",
+    "bump_many",
+    "check_strict",
+    "find_versions",
+    "latest_by",
+    "merge_sorted",
+    "nlargest",
+    "nsmallest",
+    "repair",
+    "repair_many",
+    "validate_many",
+    "version_from_filename",
+    "versions_from_filenames",
 )
 
 from ._helpers import fixup_module_metadata
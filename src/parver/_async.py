@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+
+from ._version import ParseError, Parser, Version
+
+
+def aparse_lines(
+    reader: AsyncIterable[bytes | str],
+    *,
+    strict: bool = False,
+    batch_size: int = 100,
+    skip_invalid: bool = False,
+) -> AsyncIterator[Version]:
+    """Parse one version per line from an asynchronous stream, such as an
+    :class:`asyncio.StreamReader`.
+
+    Lines are read only as versions are consumed, so a slow consumer applies
+    backpressure to the stream. Reading buffered data does not suspend, so
+    control is given back to the event loop after every `batch_size` lines.
+    Blank lines are ignored. Invalid arguments are rejected when this
+    function is called, before the stream is read.
+
+    :param reader: Asynchronous iterable of lines, as :class:`bytes` (decoded
+        as UTF-8) or :class:`str`.
+    :param strict: Enable strict parsing of the canonical PEP 440 format.
+    :param batch_size: Number of lines to parse before yielding control to
+        the event loop.
+    :param skip_invalid: Skip lines which would raise :exc:`ParseError` or
+        :exc:`UnicodeDecodeError` instead of raising them.
+    :raises TypeError: `batch_size` is not an integer.
+    :raises ValueError: `batch_size` is not positive.
+    """
+    if isinstance(batch_size, bool) or not isinstance(batch_size, int):
+        msg = "batch_size must be an integer"
+        raise TypeError(msg)
+    if batch_size < 1:
+        msg = "batch_size must be positive"
+        raise ValueError(msg)
+
+    return _aparse_lines(reader, Parser(strict=strict), batch_size, skip_invalid)
+
+
+async def _aparse_lines(
+    reader: AsyncIterable[bytes | str],
+    parser: Parser,
+    batch_size: int,
+    skip_invalid: bool,
+) -> AsyncIterator[Version]:
+    count = 0
+    async for line in reader:
+        count += 1
+        if count % batch_size == 0:
+            await asyncio.sleep(0)
+
+        try:
+            if isinstance(line, bytes):
+                line = line.decode()
+            if not line or line.isspace():
+                continue
+            version = parser.parse(line)
+        except (ParseError, UnicodeDecodeError):
+            if not skip_invalid:
+                raise
+            continue
+        yield version
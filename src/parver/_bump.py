@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any, Literal, get_args
+
+from ._release_int import check_width
+from ._version import (
+    Version,
+    VersionBuilder,
+    check_by,
+    check_index,
+    check_min_length,
+)
+
+_Operation = Literal[
+    "bump_epoch",
+    "bump_release",
+    "bump_release_to",
+    "set_release",
+    "bump_pre",
+    "bump_post",
+    "bump_dev",
+    "truncate",
+]
+
+_OPERATIONS: tuple[_Operation, ...] = get_args(_Operation)
+
+
+def _prepare(
+    op: _Operation, kwargs: dict[str, Any]
+) -> Callable[[VersionBuilder], VersionBuilder]:
+    """Validate the arguments for `op` and return a function which applies it
+    to a builder without validating them again.
+    """
+    bound = inspect.signature(getattr(VersionBuilder, op)).bind(None, **kwargs)
+    bound.apply_defaults()
+    args = bound.arguments
+
+    if "by" in args:
+        check_by(args["by"])
+    if "index" in args:
+        check_index(args["index"])
+    if "min_length" in args:
+        check_min_length(args["min_length"])
+    if args.get("width") is not None:
+        check_width(args["width"])
+
+    match op:
+        case "bump_epoch":
+            return partial(
+                VersionBuilder._bump_epoch, by=args["by"], width=args["width"]
+            )
+        case "bump_release":
+            return partial(
+                VersionBuilder._set_release, index=args["index"], width=args["width"]
+            )
+        case "bump_release_to":
+            return partial(
+                VersionBuilder._set_release,
+                index=args["index"],
+                value=args["value"],
+                width=args["width"],
+            )
+        case "set_release":
+            return partial(
+                VersionBuilder._set_release,
+                index=args["index"],
+                value=args["value"],
+                bump=False,
+                width=args["width"],
+            )
+        case "bump_pre" | "bump_post" | "bump_dev":
+            return partial(
+                getattr(VersionBuilder, f"_{op}"),
+                tag=args["tag"],
+                by=args["by"],
+                width=args["width"],
+            )
+        case "truncate":
+            return partial(VersionBuilder._truncate, min_length=args["min_length"])
+
+
+def bump_many(
+    versions: Iterable[Version], op: _Operation, /, **kwargs: Any
+) -> list[Version]:
+    """Apply the same change to many versions.
+
+    This is equivalent to ``[getattr(v, op)(**kwargs) for v in versions]``,
+    except that the arguments are validated once, before any version is
+    changed, instead of for each version.
+
+    :param versions: Versions to change.
+    :param op: Name of the :class:`Version` method to apply. One of
+        ``"bump_epoch"``, ``"bump_release"``, ``"bump_release_to"``,
+        ``"set_release"``, ``"bump_pre"``, ``"bump_post"``, ``"bump_dev"``, or
+        ``"truncate"``.
+    :param kwargs: Keyword arguments for the method.
+    :raises ValueError: `op` is not one of the supported methods.
+    :raises TypeError: `kwargs` are not valid arguments for the method.
+
+    .. rubric:: Example
+
+    >>> versions = [Version.parse("1.2"), Version.parse("2.0.1")]
+    >>> bump_many(versions, "bump_release", index=1)
+    [<Version '1.3'>, <Version '2.1.0'>]
+    >>> bump_many(versions, "bump_pre", tag="rc")
+    [<Version '1.2rc0'>, <Version '2.0.1rc0'>]
+    """
+    if op not in _OPERATIONS:
+        msg = f"op must be one of {', '.join(map(repr, _OPERATIONS))} (got {op!r})"
+        raise ValueError(msg)
+
+    apply = _prepare(op, kwargs)
+    return [apply(VersionBuilder(version)).build() for version in versions]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from ._version import ParseError, Parser, Version
+
+WHEEL_SUFFIX = ".whl"
+SDIST_SUFFIXES: tuple[str, ...] = (".tar.gz", ".zip", ".tar.bz2", ".tar.xz", ".tgz")
+
+
+class InvalidFilenameError(ParseError):
+    """Raised when a distribution filename does not have the expected shape.
+
+    .. doctest::
+
+        >>> version_from_filename("pkg-1.0.exe")
+        Traceback (most recent call last):
+        ...
+        parver.InvalidFilenameError: Invalid distribution filename 'pkg-1.0.exe': unknown file extension
+    """
+
+    def __init__(self, filename: str, reason: str):
+        super().__init__()
+        self.filename = filename
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"Invalid distribution filename {self.filename!r}: {self.reason}"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        cls = type(self)
+        return cls.__new__, (cls, *self.args), self.__dict__
+
+
+def _version_span(filename: str) -> tuple[int, int]:
+    """Return the indices delimiting the version field of a wheel or sdist
+    filename.
+    """
+    if filename.endswith(WHEEL_SUFFIX):
+        # {name}-{version}(-{build})?-{python}-{abi}-{platform}.whl. The name
+        # and version cannot contain dashes, so the version is the second
+        # field.
+        dashes = filename.count("-", 0, -len(WHEEL_SUFFIX))
+        if dashes not in (4, 5):
+            raise InvalidFilenameError(filename, "wrong number of parts")
+        start = filename.index("-") + 1
+        return start, filename.index("-", start)
+
+    for suffix in SDIST_SUFFIXES:
+        if filename.endswith(suffix):
+            # {name}-{version}.tar.gz. Legacy names may contain dashes, so the
+            # version is everything after the last one.
+            end = len(filename) - len(suffix)
+            start = filename.rfind("-", 0, end) + 1
+            if not start:
+                raise InvalidFilenameError(filename, "missing version")
+            return start, end
+
+    raise InvalidFilenameError(filename, "unknown file extension")
+
+
+def version_from_filename(filename: str, *, strict: bool = False) -> Version:
+    """Parse the version field of a wheel or source distribution filename.
+
+    :param filename: A ``.whl`` filename, or a source distribution filename
+        such as ``.tar.gz`` or ``.zip``.
+    :param strict: Enable strict parsing of the canonical PEP 440 format.
+    :raises InvalidFilenameError: If the filename is not a recognised
+        distribution filename.
+    :raises ParseError: If the version is not valid for the given value of
+        `strict`.
+
+    .. rubric:: Example
+
+    >>> version_from_filename("pkg-1.2.3-py3-none-any.whl")
+    <Version '1.2.3'>
+    >>> version_from_filename("pkg-1.2.3.tar.gz")
+    <Version '1.2.3'>
+    """
+    start, end = _version_span(filename)
+    return Parser(filename[start:end], strict=strict).parse()
+
+
+def versions_from_filenames(
+    filenames: Iterable[str],
+    *,
+    strict: bool = False,
+    skip_invalid: bool = False,
+) -> Iterator[Version]:
+    """Parse the version field of many distribution filenames.
+
+    This is equivalent to calling :func:`version_from_filename` for each
+    filename, except that a single parser is reused for every filename and
+    invalid filenames may be skipped.
+
+    :param filenames: Wheel or source distribution filenames.
+    :param strict: Enable strict parsing of the canonical PEP 440 format.
+    :param skip_invalid: Skip filenames which would raise :exc:`ParseError`
+        instead of raising it.
+
+    .. rubric:: Example
+
+    >>> filenames = ["a-1.0.tar.gz", "b.txt", "c-2.0-py3-none-any.whl"]
+    >>> list(versions_from_filenames(filenames, skip_invalid=True))
+    [<Version '1.0'>, <Version '2.0'>]
+    """
+    parser = Parser(strict=strict)
+    for filename in filenames:
+        try:
+            start, end = _version_span(filename)
+            yield parser.parse(filename[start:end])
+        except ParseError:
+            if not skip_invalid:
+                raise
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from typing import Any
+
+from ._helpers import Infinity, NegativeInfinity
+from ._version import Version
+
+_sort_key = attrgetter("sort_key")
+
+
+class VersionIndex:
+    """An immutable, sorted collection of versions for answering many range
+    queries, such as ``>=1.2,<2``, without comparing every version.
+
+    Sorting the versions once means each query is a binary search on
+    :attr:`Version.sort_key`, taking time proportional to the logarithm of
+    the number of versions. A query's :meth:`span` is a :class:`range` of
+    positions in :attr:`versions`, so checking whether the version at a
+    position matches a query does not compare versions at all.
+
+    :param versions: Versions to index. Equal versions are all kept, in the
+        order they are given.
+
+    .. rubric:: Example
+
+    >>> index = VersionIndex(
+    ...     Version.parse(v) for v in ["2.0", "1.0", "1.5", "1.5.post1", "2.1"]
+    ... )
+    >>> index.between(Version.parse("1.5"), Version.parse("2.0"))
+    [<Version '1.5'>, <Version '1.5.post1'>]
+    >>> index.span(Version.parse("1.5"))
+    range(1, 5)
+    """
+
+    __slots__ = ("_keys", "versions")
+
+    versions: tuple[Version, ...]
+    """The indexed versions, in ascending order."""
+
+    _keys: list[tuple[Any, ...]]
+
+    def __init__(self, versions: Iterable[Version]) -> None:
+        self.versions = tuple(sorted(versions, key=_sort_key))
+        self._keys = list(map(_sort_key, self.versions))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} size={len(self.versions)}>"
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    def __iter__(self) -> Iterator[Version]:
+        return iter(self.versions)
+
+    def __contains__(self, version: object) -> bool:
+        if not isinstance(version, Version):
+            return False
+        key = version.sort_key
+        i = bisect_left(self._keys, key)
+        return i < len(self._keys) and self._keys[i] == key
+
+    def span(
+        self,
+        lower: Version | None = None,
+        upper: Version | None = None,
+        *,
+        include_lower: bool = True,
+        include_upper: bool = False,
+    ) -> range:
+        """Return the positions in :attr:`versions` of the versions between
+        `lower` and `upper`.
+
+        :param lower: The lower bound, or `None` for no lower bound.
+        :param upper: The upper bound, or `None` for no upper bound.
+        :param include_lower: Whether versions equal to `lower` are included.
+        :param include_upper: Whether versions equal to `upper` are included.
+        """
+        keys = self._keys
+
+        if lower is None:
+            start = 0
+        elif include_lower:
+            start = bisect_left(keys, lower.sort_key)
+        else:
+            start = bisect_right(keys, lower.sort_key)
+
+        if upper is None:
+            stop = len(keys)
+        elif include_upper:
+            stop = bisect_right(keys, upper.sort_key, start)
+        else:
+            stop = bisect_left(keys, upper.sort_key, start)
+
+        return range(start, max(start, stop))
+
+    def between(
+        self,
+        lower: Version | None = None,
+        upper: Version | None = None,
+        *,
+        include_lower: bool = True,
+        include_upper: bool = False,
+    ) -> list[Version]:
+        """Return the versions between `lower` and `upper`, in ascending
+        order.
+
+        See :meth:`span` for the parameters.
+        """
+        span = self.span(
+            lower, upper, include_lower=include_lower, include_upper=include_upper
+        )
+        return list(self.versions[span.start : span.stop])
+
+
+@dataclass(frozen=True, slots=True)
+class VersionRange:
+    """A range of versions, such as ``>=1.2,<2``, for :class:`RangeIndex`.
+
+    The bounds compare versions as the comparison operators do, so unlike
+    the PEP 440 ``<`` specifier, pre-releases of `upper` are in the range.
+
+    .. rubric:: Example
+
+    >>> Version.parse("1.5") in VersionRange(Version.parse("1.2"))
+    True
+    """
+
+    lower: Version | None = None
+    """The lower bound, or `None` for no lower bound."""
+
+    upper: Version | None = None
+    """The upper bound, or `None` for no upper bound."""
+
+    include_lower: bool = True
+    """Whether versions equal to :attr:`lower` are in the range."""
+
+    include_upper: bool = False
+    """Whether versions equal to :attr:`upper` are in the range."""
+
+    def _bounds(self) -> tuple[Any, Any]:
+        """Return inclusive bounds on :attr:`Version.sort_key`."""
+        if self.lower is None:
+            lower: Any = NegativeInfinity
+        elif self.include_lower:
+            lower = self.lower.sort_key
+        else:
+            lower = self.lower.successor_key()
+
+        if self.upper is None:
+            upper: Any = Infinity
+        elif self.include_upper:
+            upper = self.upper.sort_key
+        else:
+            upper = self.upper.predecessor_key()
+
+        return lower, upper
+
+    def __contains__(self, version: object) -> bool:
+        if not isinstance(version, Version):
+            return False
+        lower, upper = self._bounds()
+        return bool(lower <= version.sort_key <= upper)
+
+
+class _Node:
+    """A node of a centered interval tree.
+
+    The intervals which contain `center` are stored here, sorted by their
+    lower bounds and, separately, by their upper bounds. Intervals entirely
+    below or above `center` are stored in `left` or `right`.
+    """
+
+    __slots__ = (
+        "center",
+        "left",
+        "lowers",
+        "lowers_ids",
+        "right",
+        "uppers",
+        "uppers_ids",
+    )
+
+    def __init__(self, intervals: list[tuple[Any, Any, int]]) -> None:
+        endpoints = sorted(
+            [lower for lower, _, _ in intervals] + [upper for _, upper, _ in intervals]
+        )
+        self.center = center = endpoints[len(endpoints) // 2]
+
+        below = [interval for interval in intervals if interval[1] < center]
+        above = [interval for interval in intervals if center < interval[0]]
+        here = [
+            interval
+            for interval in intervals
+            if not interval[1] < center and not center < interval[0]
+        ]
+
+        by_lower = sorted(here, key=itemgetter(0))
+        self.lowers = [lower for lower, _, _ in by_lower]
+        self.lowers_ids = [i for _, _, i in by_lower]
+        by_upper = sorted(here, key=itemgetter(1))
+        self.uppers = [upper for _, upper, _ in by_upper]
+        self.uppers_ids = [i for _, _, i in by_upper]
+
+        self.left = _Node(below) if below else None
+        self.right = _Node(above) if above else None
+
+
+class RangeIndex:
+    """An immutable collection of version ranges for finding the ranges
+    which contain a version, without checking every range.
+
+    This is the reverse of :class:`VersionIndex`. The ranges are stored in
+    an interval tree on their bounds, converted to inclusive bounds on
+    :attr:`Version.sort_key` with :meth:`Version.successor_key` and
+    :meth:`Version.predecessor_key`. Each query takes time proportional to
+    the logarithm of the number of ranges, plus the number of ranges found.
+
+    :param ranges: Ranges to index.
+
+    .. rubric:: Example
+
+    >>> v = Version.parse
+    >>> index = RangeIndex(
+    ...     [
+    ...         VersionRange(v("1.0"), v("2.0")),
+    ...         VersionRange(v("1.5"), include_lower=False),
+    ...         VersionRange(upper=v("1.5"), include_upper=True),
+    ...     ]
+    ... )
+    >>> index.containing(v("1.5"))
+    [0, 2]
+    >>> index.containing(v("2.0"))
+    [1]
+    """
+
+    __slots__ = ("_root", "ranges")
+
+    ranges: tuple[VersionRange, ...]
+    """The indexed ranges, in the order they were given."""
+
+    _root: _Node | None
+
+    def __init__(self, ranges: Iterable[VersionRange]) -> None:
+        self.ranges = tuple(ranges)
+        intervals = []
+        for i, version_range in enumerate(self.ranges):
+            lower, upper = version_range._bounds()
+            # Empty ranges contain no versions.
+            if not upper < lower:
+                intervals.append((lower, upper, i))
+        self._root = _Node(intervals) if intervals else None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} size={len(self.ranges)}>"
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def containing(self, version: Version) -> list[int]:
+        """Return the positions in :attr:`ranges` of the ranges which contain
+        `version`, in ascending order.
+        """
+        key = version.sort_key
+        found: list[int] = []
+        node = self._root
+        while node is not None:
+            if key < node.center:
+                # The intervals here end after the key, so they contain it
+                # if they start at or before it.
+                found += node.lowers_ids[: bisect_right(node.lowers, key)]
+                node = node.left
+            elif node.center < key:
+                found += node.uppers_ids[bisect_left(node.uppers, key) :]
+                node = node.right
+            else:
+                found += node.lowers_ids
+                break
+        found.sort()
+        return found
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     if sys.version_info >= (3, 11):
@@ -17,32 +17,81 @@ def intwidth(value: int | str) -> int:
         return len(value.strip().lstrip("-+").replace("_", ""))
 
 
+# Instances are immutable, so small zero-padded ones are shared. The bounds
+# cover the padded numbers seen in practice (e.g. months and days in CalVer)
+# while keeping the cache small. Unpadded numbers are never shared: pickles
+# create them without a width and set it afterwards (see __setstate__).
+_CACHE_MAX_VALUE = 1000
+_CACHE_MAX_WIDTH = 4
+_cache: dict[tuple[int, int], ReleaseInt] = {}
+
+_R = TypeVar("_R", bound="ReleaseInt")
+
+
+def _new(cls: type[_R], value: int, width: int) -> _R:
+    obj = int.__new__(cls, value)
+    object.__setattr__(obj, "_minimum_width", width)
+    return obj
+
+
+def _make(cls: type[_R], value: int, width: int) -> _R:
+    if (
+        cls is ReleaseInt
+        and 1 < width <= _CACHE_MAX_WIDTH
+        and 0 <= value < _CACHE_MAX_VALUE
+    ):
+        key = value, width
+        try:
+            return _cache[key]  # type: ignore[return-value]
+        except KeyError:
+            obj = _new(cls, value, width)
+            _cache[key] = obj
+            return obj
+    return _new(cls, value, width)
+
+
+def check_width(width: int) -> None:
+    """Validate a minimum width for a number."""
+    if isinstance(width, bool) or not isinstance(width, int):
+        msg = "width must be an integer"
+        raise TypeError(msg)
+    if width < 1:
+        msg = "width must be positive"
+        raise ValueError(msg)
+
+
 class ReleaseInt(int):
     _minimum_width: int
 
     def __new__(cls, value: int | str, *, width: int | None = None) -> Self:
         if width is not None:
-            if isinstance(width, bool) or not isinstance(width, int):
-                msg = "width must be an integer"
-                raise TypeError(msg)
-            if width < 1:
-                msg = "width must be positive"
-                raise ValueError(msg)
+            check_width(width)
 
         if isinstance(value, str):
-            parsed_value = int(value)
-            obj = super().__new__(cls, parsed_value)
-            obj._minimum_width = intwidth(value) if width is None else width
+            return _make(cls, int(value), intwidth(value) if width is None else width)
         elif isinstance(value, ReleaseInt):
-            obj = super().__new__(cls, value)
-            obj._minimum_width = value._minimum_width if width is None else width
+            return _make(
+                cls, int(value), value._minimum_width if width is None else width
+            )
         elif isinstance(value, int):
-            obj = super().__new__(cls, value)
-            obj._minimum_width = 1 if width is None else width
+            return _make(cls, int(value), 1 if width is None else width)
         else:
             msg = f"Unsupported type: {type(value)}"
             raise TypeError(msg)
-        return obj
+
+    def __setattr__(self, name: str, value: object) -> None:
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickles store the width as instance state, which was also the
+        # format before instances were immutable. Unpickling calls __new__
+        # with only the value, so this instance is never a shared one.
+        object.__setattr__(self, "_minimum_width", state["_minimum_width"])
 
     @property
     def minimum_width(self) -> int:
@@ -50,12 +99,11 @@ class ReleaseInt(int):
 
     def zero_like(self) -> ReleaseInt:
         """Return a zero with the same width preference as this number."""
-        return ReleaseInt(0, width=self.minimum_width)
+        return _make(ReleaseInt, 0, self._minimum_width)
 
     def __add__(self, other: object) -> ReleaseInt:
         if isinstance(other, int):
-            result = int(self) + int(other)
-            return ReleaseInt(result, width=self.minimum_width)
+            return _make(ReleaseInt, int(self) + int(other), self._minimum_width)
         return NotImplemented
 
     def __radd__(self, other: object) -> ReleaseInt:
@@ -63,8 +111,7 @@ class ReleaseInt(int):
 
     def __sub__(self, other: object) -> ReleaseInt:
         if isinstance(other, int):
-            result = int(self) - int(other)
-            return ReleaseInt(result, width=self.minimum_width)
+            return _make(ReleaseInt, int(self) - int(other), self._minimum_width)
         return NotImplemented
 
     def __str__(self) -> str:
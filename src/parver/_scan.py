@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from ._version import ParseError, Parser, Version
+
+# A version may only start where it isn't glued to a preceding word or number,
+# e.g. the "3" in "py3" or the "11" in "3.11" are not candidates.
+_candidate_start = re.compile(r"(?<![A-Za-z0-9.])[vV]?[0-9]")
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isascii() and c.isalnum()
+
+
+@dataclass(frozen=True, slots=True)
+class VersionMatch:
+    """A version found by :func:`find_versions`."""
+
+    version: Version
+    """The parsed version."""
+
+    start: int
+    """Index of the first character of the version in the searched text."""
+
+    end: int
+    """Index just past the last character of the version in the searched
+    text.
+    """
+
+    @property
+    def span(self) -> tuple[int, int]:
+        """A ``(start, end)`` tuple, like :meth:`re.Match.span`."""
+        return self.start, self.end
+
+
+def find_versions(text: str, *, strict: bool = False) -> Iterator[VersionMatch]:
+    """Find every version number in a piece of free text.
+
+    Each match is the longest version that can be parsed at that position,
+    and it must not be directly preceded or followed by a letter or digit. The
+    text is scanned from left to right, so matches never overlap.
+
+    :param text: Text to search.
+    :param strict: Only report versions which are in the canonical PEP 440
+        format. Versions which are not are skipped rather than shortened.
+
+    .. rubric:: Example
+
+    >>> for match in find_versions("Upgrade from v1.2-beta to 1.3 (not py3)"):
+    ...     print(match.span, match.version)
+    (13, 22) v1.2-beta
+    (26, 29) 1.3
+    """
+    parser = Parser(text)
+    strict_parser = Parser(strict=True)
+    pos = 0
+    while (candidate := _candidate_start.search(text, pos)) is not None:
+        start = candidate.start()
+        result = parser.parse_prefix(start)
+        if result is None:
+            pos = start + 1
+            continue
+
+        version, end = result
+        if end < len(text) and _is_word_char(text[end]):
+            pos = start + 1
+            continue
+
+        pos = end
+        if strict:
+            try:
+                version = strict_parser.parse(text[start:end])
+            except ParseError:
+                continue
+        yield VersionMatch(version, start, end)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Iterable, Iterator
+from operator import attrgetter
+from typing import Any
+
+from ._version import Version
+
+_sort_key = attrgetter("sort_key")
+
+
+def check_prefix_len(prefix_len: int) -> None:
+    """Validate the 'prefix_len' parameter for latest_by."""
+    if isinstance(prefix_len, bool) or not isinstance(prefix_len, int):
+        msg = "prefix_len must be an integer"
+        raise TypeError(msg)
+
+    if prefix_len < 1:
+        msg = "prefix_len must be positive"
+        raise ValueError(msg)
+
+
+def check_k(k: int) -> None:
+    """Validate the 'k' parameter for nlargest and nsmallest."""
+    if isinstance(k, bool) or not isinstance(k, int):
+        msg = "k must be an integer"
+        raise TypeError(msg)
+
+    if k < 0:
+        msg = "k cannot be negative"
+        raise ValueError(msg)
+
+
+def _filter_prereleases(versions: Iterable[Version]) -> Iterable[Version]:
+    return (version for version in versions if not version.is_prerelease)
+
+
+def nlargest(
+    k: int, versions: Iterable[Version], *, include_prereleases: bool = True
+) -> list[Version]:
+    """Return the `k` largest versions, largest first.
+
+    This is equivalent to ``sorted(versions, reverse=True)[:k]``, but only
+    `k` versions are kept at a time, in a heap ordered by
+    :attr:`Version.sort_key`. Pass a generator to find the largest versions
+    without keeping every version in memory. Of equal versions, the first
+    one is kept.
+
+    :param k: The number of versions to return.
+    :param versions: Versions to choose from.
+    :param include_prereleases: Whether pre-releases and development releases
+        are considered.
+    :raises TypeError: `k` is not an integer.
+    :raises ValueError: `k` is negative.
+
+    .. rubric:: Example
+
+    >>> versions = (Version.parse(v) for v in ["1.0", "2.0rc1", "1.5", "0.9"])
+    >>> nlargest(2, versions)
+    [<Version '2.0rc1'>, <Version '1.5'>]
+    """
+    check_k(k)
+    if not include_prereleases:
+        versions = _filter_prereleases(versions)
+    return heapq.nlargest(k, versions, key=_sort_key)
+
+
+def nsmallest(
+    k: int, versions: Iterable[Version], *, include_prereleases: bool = True
+) -> list[Version]:
+    """Return the `k` smallest versions, smallest first.
+
+    This is equivalent to ``sorted(versions)[:k]``. See :func:`nlargest`.
+
+    :param k: The number of versions to return.
+    :param versions: Versions to choose from.
+    :param include_prereleases: Whether pre-releases and development releases
+        are considered.
+    :raises TypeError: `k` is not an integer.
+    :raises ValueError: `k` is negative.
+
+    .. rubric:: Example
+
+    >>> versions = [Version.parse(v) for v in ["1.0", "1.0a1", "1.5", "0.9.dev0"]]
+    >>> nsmallest(2, versions, include_prereleases=False)
+    [<Version '1.0'>, <Version '1.5'>]
+    """
+    check_k(k)
+    if not include_prereleases:
+        versions = _filter_prereleases(versions)
+    return heapq.nsmallest(k, versions, key=_sort_key)
+
+
+def merge_sorted(
+    *iterables: Iterable[Version], dedupe: bool = False
+) -> Iterator[Version]:
+    """Lazily merge sorted iterables of versions into one sorted iterator.
+
+    This is like :func:`heapq.merge` with :attr:`Version.sort_key`: only one
+    version from each iterable is kept at a time. Equal versions are
+    yielded in the order of the iterables they come from.
+
+    :param iterables: Iterables of versions, each sorted in ascending order.
+    :param dedupe: Yield only the first of equal versions, such as ``1.0``
+        and ``1.0.0``.
+
+    .. rubric:: Example
+
+    >>> a = [Version.parse(v) for v in ["1.0", "1.2", "2.0"]]
+    >>> b = [Version.parse(v) for v in ["1.0.0", "1.1", "2.0"]]
+    >>> list(merge_sorted(a, b, dedupe=True))
+    [<Version '1.0'>, <Version '1.1'>, <Version '1.2'>, <Version '2.0'>]
+    """
+    merged = heapq.merge(*iterables, key=_sort_key)
+    if not dedupe:
+        yield from merged
+        return
+
+    previous: Any = None
+    for version in merged:
+        key = version.sort_key
+        if key != previous:
+            previous = key
+            yield version
+
+
+class LargestVersions:
+    """Keep track of the `k` largest versions seen so far.
+
+    This is the incremental form of :func:`nlargest`, for versions which do
+    not come from a single iterable, such as those from :func:`aparse_lines`.
+    Only `k` versions are kept at a time.
+
+    :param k: The number of versions to keep.
+    :param include_prereleases: Whether pre-releases and development releases
+        are kept.
+    :raises TypeError: `k` is not an integer.
+    :raises ValueError: `k` is negative.
+
+    .. rubric:: Example
+
+    >>> largest = LargestVersions(2)
+    >>> for v in ["1.0", "2.0rc1", "1.5", "0.9"]:
+    ...     largest.add(Version.parse(v))
+    >>> largest.result()
+    [<Version '2.0rc1'>, <Version '1.5'>]
+    """
+
+    __slots__ = ("_counter", "_heap", "include_prereleases", "k")
+
+    k: int
+    """The number of versions to keep."""
+
+    include_prereleases: bool
+    """Whether pre-releases and development releases are kept."""
+
+    _heap: list[tuple[Any, int, Version]]
+    _counter: itertools.count[int]
+
+    def __init__(self, k: int, *, include_prereleases: bool = True) -> None:
+        check_k(k)
+        self.k = k
+        self.include_prereleases = include_prereleases
+        # A min-heap, so the smallest kept version is the first one replaced.
+        # Entries are ordered by decreasing insertion order for equal keys,
+        # so that the first of equal versions is kept, as in nlargest.
+        self._heap = []
+        self._counter = itertools.count(0, -1)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} k={self.k} size={len(self._heap)}>"
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def add(self, version: Version) -> None:
+        """Add a version, dropping the smallest kept version if there are
+        more than :attr:`k`.
+        """
+        if not self.include_prereleases and version.is_prerelease:
+            return
+
+        entry = version.sort_key, next(self._counter), version
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self._heap and self._heap[0] < entry:
+            heapq.heapreplace(self._heap, entry)
+
+    def update(self, versions: Iterable[Version]) -> None:
+        """Add each version in `versions`."""
+        for version in versions:
+            self.add(version)
+
+    def result(self) -> list[Version]:
+        """Return the kept versions, largest first."""
+        return [version for _, _, version in sorted(self._heap, reverse=True)]
+
+
+def latest_by(
+    versions: Iterable[Version],
+    *,
+    prefix_len: int = 2,
+    include_prereleases: bool = False,
+) -> dict[tuple[int, tuple[int, ...]], Version]:
+    """Find the latest version in each release series.
+
+    Versions are grouped by their epoch and the first `prefix_len` release
+    numbers, with missing numbers treated as zero, so ``1`` and ``1.0.3``
+    are both in the ``(0, (1, 0))`` group when `prefix_len` is 2.
+
+    The versions are consumed in a single pass, keeping only the latest
+    version of each group, so memory use depends on the number of groups
+    rather than the number of versions. If equal versions such as ``1.0`` and
+    ``1.0.0`` are the latest in a group, the first one is kept.
+
+    :param versions: Versions to group.
+    :param prefix_len: The number of release numbers which identify a group.
+    :param include_prereleases: Whether pre-releases and development releases
+        are considered. Post-releases are always considered.
+    :return: The latest version in each group, keyed by ``(epoch, prefix)``
+        and ordered by key.
+
+    .. rubric:: Example
+
+    >>> versions = [
+    ...     Version.parse(v) for v in ["1.2.0", "1.2.3", "1.3", "2.0rc1", "1!1.2"]
+    ... ]
+    >>> for group, version in latest_by(versions).items():
+    ...     print(group, version)
+    (0, (1, 2)) 1.2.3
+    (0, (1, 3)) 1.3
+    (1, (1, 2)) 1!1.2
+    >>> latest_by(versions, prefix_len=1, include_prereleases=True)[0, (2,)]
+    <Version '2.0rc1'>
+    """
+    check_prefix_len(prefix_len)
+
+    padding = (0,) * prefix_len
+    latest: dict[tuple[int, tuple[int, ...]], Version] = {}
+    for version in versions:
+        if not include_prereleases and version.is_prerelease:
+            continue
+
+        # The key's release has trailing zeros removed, so it only needs to
+        # be padded when it is shorter than the prefix.
+        key = version.sort_key
+        prefix = key[1][:prefix_len]
+        if len(prefix) < prefix_len:
+            prefix = (prefix + padding)[:prefix_len]
+
+        group = key[0], prefix
+        current = latest.get(group)
+        if current is None or current.sort_key < key:
+            latest[group] = version
+
+    return dict(sorted(latest.items()))
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+
+from ._helpers import UNSET, UnsetType
+from ._release_int import ReleaseInt
+from ._version import (
+    PRE_TAG_STRICT,
+    ParseError,
+    Parser,
+    Version,
+    _normalize_local,
+)
+
+
+def _canonical_str(version: Version) -> str:
+    """Return the spelling of `version` that strict mode accepts.
+
+    This is the same as ``str(version.normalize())``, except that an explicit
+    zero epoch is kept, since strict mode allows it.
+    """
+    parts: list[str] = []
+
+    if not version.epoch_implicit:
+        parts.append(f"{int(version.epoch)}!")
+
+    parts.append(".".join([str(int(x)) for x in version.release]))
+
+    if version.pre is not None:
+        parts.append(f"{version._pre_tag_normalized}{int(version.pre)}")
+
+    if version.post is not None:
+        parts.append(f".post{int(version.post)}")
+
+    if version.dev is not None:
+        parts.append(f".dev{int(version.dev)}")
+
+    if version.local is not None:
+        parts.append(f"+{_normalize_local(version.local)}")
+
+    return "".join(parts)
+
+
+class StrictCheck:
+    """The result of :func:`check_strict`."""
+
+    __slots__ = ("_strict_error", "is_strict", "text", "version")
+
+    text: str
+    """The string that was parsed."""
+
+    version: Version
+    """The version, as parsed in permissive mode."""
+
+    is_strict: bool
+    """Whether :attr:`text` is in the canonical format accepted by strict
+    mode.
+    """
+
+    _strict_error: ParseError | None | UnsetType
+
+    def __init__(self, text: str, version: Version, *, is_strict: bool) -> None:
+        self.text = text
+        self.version = version
+        self.is_strict = is_strict
+        self._strict_error = None if is_strict else UNSET
+
+    @property
+    def strict_error(self) -> ParseError | None:
+        """The error that parsing :attr:`text` in strict mode raises, or `None`
+        if :attr:`is_strict` is `True`.
+
+        It is computed the first time it is accessed.
+        """
+        if self._strict_error is UNSET:
+            try:
+                Parser(self.text, strict=True).parse()
+            except ParseError as exc:
+                self._strict_error = exc
+            else:  # pragma: no cover
+                msg = f"{self.text!r} was expected to fail strict parsing"
+                raise AssertionError(msg)
+        assert not isinstance(self._strict_error, UnsetType)
+        return self._strict_error
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.text!r} is_strict={self.is_strict}>"
+
+
+def check_strict(version: str) -> StrictCheck:
+    """Parse a version in permissive mode and check whether strict mode would
+    accept it, without parsing it twice.
+
+    :param version: Version number as defined in PEP 440.
+    :raises ParseError: If version is not valid in permissive mode.
+
+    .. rubric:: Example
+
+    >>> check = check_strict("1.02")
+    >>> check.version
+    <Version '1.02'>
+    >>> check.is_strict
+    False
+    >>> print(check.strict_error)
+    Release number '02' has leading zeros in strict mode; use '2'
+    """
+    parsed = Parser(version).parse()
+    return StrictCheck(
+        version,
+        parsed,
+        is_strict=_canonical_str(parsed) == version.strip(),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationFailure:
+    """A version rejected by :func:`validate_many`."""
+
+    index: int
+    """Position of the version in the validated items."""
+
+    text: str
+    """The rejected version string."""
+
+    error: ParseError
+    """The error that parsing :attr:`text` raises."""
+
+    suggestion: str | None
+    """The canonical spelling of :attr:`text` if it is valid in permissive
+    mode, otherwise `None`.
+    """
+
+
+@dataclass(slots=True)
+class ValidationReport:
+    """The result of :func:`validate_many`."""
+
+    total: int = 0
+    """The number of items that were validated."""
+
+    failures: list[ValidationFailure] = field(default_factory=list)
+    """The rejected items, in input order."""
+
+    counts: Counter[type[ParseError]] = field(default_factory=Counter)
+    """The number of failures for each error class."""
+
+    @property
+    def valid(self) -> int:
+        """The number of items that were accepted."""
+        return self.total - len(self.failures)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every item was accepted."""
+        return not self.failures
+
+
+def validate_many(items: Iterable[str], *, strict: bool = True) -> ValidationReport:
+    """Validate many versions at once, collecting every failure instead of
+    raising.
+
+    This is faster than calling :meth:`Version.parse` for each item, because
+    no :class:`Version` objects are constructed for valid items.
+
+    :param items: Version strings to validate.
+    :param strict: Validate the canonical PEP 440 format.
+
+    .. rubric:: Example
+
+    >>> report = validate_many(["1.0", "1.02", "1.0alpha1", "1.0+ABC", "x"])
+    >>> report.valid
+    1
+    >>> for failure in report.failures:
+    ...     print(failure.index, type(failure.error).__name__, failure.suggestion)
+    1 LeadingZerosError 1.2
+    2 StrictPreTagError 1.0a1
+    3 InvalidLocalError 1.0+abc
+    4 NoLeadingNumberError None
+    """
+    report = ValidationReport()
+    parser = Parser(strict=strict)
+    permissive_parser = Parser()
+    for index, item in enumerate(items):
+        try:
+            parser.validate(item)
+        except ParseError as exc:
+            suggestion = None
+            if strict:
+                try:
+                    suggestion = _canonical_str(permissive_parser.parse(item))
+                except ParseError:
+                    pass
+            report.failures.append(ValidationFailure(index, item, exc, suggestion))
+            report.counts[type(exc)] += 1
+        report.total += 1
+    return report
+
+
+class RepairRule(Enum):
+    """A reason why a version was not in strict form, as reported by
+    :func:`repair`.
+    """
+
+    V_PREFIX = "v-prefix"
+    """The version has a ``v`` prefix."""
+
+    LEADING_ZEROS = "leading-zeros"
+    """A number has leading zeros."""
+
+    PRE_TAG = "pre-tag"
+    """The pre-release tag is not ``a``, ``b``, or ``rc``."""
+
+    POST_TAG = "post-tag"
+    """The post-release tag is not ``post``."""
+
+    DEV_TAG = "dev-tag"
+    """The development release tag is not ``dev``."""
+
+    IMPLICIT_POST = "implicit-post"
+    """The version uses the ``-N`` post-release shorthand."""
+
+    IMPLICIT_NUMBER = "implicit-number"
+    """A pre, post, or development release number is omitted."""
+
+    SEPARATOR = "separator"
+    """A pre, post, or development release segment has non-canonical
+    separators.
+    """
+
+    LOCAL = "local"
+    """The local version segment is not lowercase, has leading zeros, or uses
+    separators other than ``.``.
+    """
+
+
+def _repair_rules(version: Version) -> tuple[RepairRule, ...]:
+    rules: list[RepairRule] = []
+
+    if version.v is not None:
+        rules.append(RepairRule.V_PREFIX)
+
+    numbers = [
+        version.epoch,
+        *version._release_parts(),
+        version.pre,
+        version.post,
+        version.dev,
+    ]
+    if any(isinstance(n, ReleaseInt) and str(n) != str(int(n)) for n in numbers):
+        rules.append(RepairRule.LEADING_ZEROS)
+
+    if version.pre_tag is not None:
+        if version.pre_tag not in PRE_TAG_STRICT:
+            rules.append(RepairRule.PRE_TAG)
+        if version.pre_sep1 is not None or version.pre_sep2 is not None:
+            rules.append(RepairRule.SEPARATOR)
+        if version.pre_implicit:
+            rules.append(RepairRule.IMPLICIT_NUMBER)
+
+    if version.post is not None:
+        if version.post_tag is None:
+            rules.append(RepairRule.IMPLICIT_POST)
+        else:
+            if version.post_tag != "post":
+                rules.append(RepairRule.POST_TAG)
+            if version.post_sep1 != "." or version.post_sep2 is not None:
+                rules.append(RepairRule.SEPARATOR)
+            if version.post_implicit:
+                rules.append(RepairRule.IMPLICIT_NUMBER)
+
+    if version.dev is not None:
+        if version.dev_tag != "dev":
+            rules.append(RepairRule.DEV_TAG)
+        if version.dev_sep1 != "." or version.dev_sep2 is not None:
+            rules.append(RepairRule.SEPARATOR)
+        if version.dev_implicit:
+            rules.append(RepairRule.IMPLICIT_NUMBER)
+
+    if version.local is not None and _normalize_local(version.local) != version.local:
+        rules.append(RepairRule.LOCAL)
+
+    return tuple(dict.fromkeys(rules))
+
+
+@dataclass(frozen=True, slots=True)
+class RepairResult:
+    """The result of :func:`repair`."""
+
+    text: str
+    """The string that was repaired."""
+
+    version: Version
+    """The version in strict form."""
+
+    rules: tuple[RepairRule, ...]
+    """The reasons :attr:`text` was not in strict form, or an empty tuple if
+    it was.
+    """
+
+    @property
+    def changed(self) -> bool:
+        """Whether :attr:`text` had to be changed."""
+        return bool(self.rules)
+
+
+def _repair(parser: Parser, text: str) -> RepairResult:
+    version = parser.parse(text)
+    rules = _repair_rules(version)
+    if rules:
+        version = version.normalize()
+    return RepairResult(text, version, rules)
+
+
+def repair(version: str) -> RepairResult:
+    """Rewrite a version in the strict form, reporting why it was not already
+    in that form.
+
+    The version is parsed once in permissive mode and normalized if needed.
+    The resulting :attr:`~RepairResult.version` is accepted by
+    ``Version.parse(..., strict=True)``.
+
+    :param version: Version number as defined in PEP 440.
+    :raises ParseError: If version is not valid in permissive mode.
+
+    .. rubric:: Example
+
+    >>> result = repair("v1.02-BETA")
+    >>> result.version
+    <Version '1.2b0'>
+    >>> [rule.value for rule in result.rules]
+    ['v-prefix', 'leading-zeros', 'pre-tag', 'separator', 'implicit-number']
+    """
+    return _repair(Parser(), version)
+
+
+def repair_many(
+    items: Iterable[str], *, skip_invalid: bool = False
+) -> Iterator[RepairResult]:
+    """Lazily :func:`repair` many versions, reusing a single parser.
+
+    :param items: Version strings to repair.
+    :param skip_invalid: Skip items which would raise :exc:`ParseError`
+        instead of raising it.
+    """
+    parser = Parser()
+    for item in items:
+        try:
+            yield _repair(parser, item)
+        except ParseError:
+            if not skip_invalid:
+                raise
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from ._version import Version, _validate_numeric_component
+
+
+class _Node:
+    __slots__ = ("children", "versions")
+
+    def __init__(self) -> None:
+        # Release number -> child node.
+        self.children: dict[int, _Node] = {}
+        # Comparison key -> version, for versions whose release, without
+        # trailing zeros, ends at this node.
+        self.versions: dict[tuple[Any, ...], Version] = {}
+
+    def __iter__(self) -> Iterator[Version]:
+        # A release sorts before any longer release it is a prefix of, so the
+        # versions at this node come before those of its children.
+        for key in sorted(self.versions):
+            yield self.versions[key]
+        for number in sorted(self.children):
+            yield from self.children[number]
+
+
+class ReleaseTrie:
+    """A set of versions, indexed by release number for finding the versions
+    in a release series, such as those matched by ``==1.2.*``.
+
+    The versions are stored in a tree with one level for each release number,
+    below a root for each epoch. Trailing zeros are ignored, so ``1``,
+    ``1.0``, and ``1.0.0`` are in the same place. Finding the versions with a
+    release prefix takes time proportional to the length of the prefix and
+    the number of versions found, rather than the number of versions stored.
+
+    Like a :class:`set`, equal versions are only stored once.
+
+    :param versions: Versions to add.
+
+    .. rubric:: Example
+
+    >>> trie = ReleaseTrie(
+    ...     Version.parse(v) for v in ["1.1", "1.2", "1.2.1rc1", "1.2.1", "1.3"]
+    ... )
+    >>> list(trie.with_prefix((1, 2)))
+    [<Version '1.2'>, <Version '1.2.1rc1'>, <Version '1.2.1'>]
+    """
+
+    __slots__ = ("_len", "_roots")
+
+    def __init__(self, versions: Iterable[Version] = ()) -> None:
+        self._roots: dict[int, _Node] = {}
+        self._len = 0
+        for version in versions:
+            self.add(version)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} size={self._len}>"
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Version]:
+        """Iterate over all versions in sorted order."""
+        for epoch in sorted(self._roots):
+            yield from self._roots[epoch]
+
+    def __contains__(self, version: object) -> bool:
+        if not isinstance(version, Version):
+            return False
+        key = version.sort_key
+        node = self._find(key[0], key[1])
+        return node is not None and key in node.versions
+
+    def _find(self, epoch: int, release: Iterable[int]) -> _Node | None:
+        node = self._roots.get(epoch)
+        for number in release:
+            if node is None:
+                break
+            node = node.children.get(number)
+        return node
+
+    def add(self, version: Version) -> None:
+        """Add a version, unless an equal version is already present."""
+        key = version.sort_key
+        epoch, release = key[0], key[1]
+
+        node = self._roots.get(epoch)
+        if node is None:
+            node = self._roots[epoch] = _Node()
+        for number in release:
+            child = node.children.get(number)
+            if child is None:
+                child = node.children[number] = _Node()
+            node = child
+
+        if key not in node.versions:
+            node.versions[key] = version
+            self._len += 1
+
+    def remove(self, version: Version) -> None:
+        """Remove a version equal to `version`.
+
+        :raises KeyError: No equal version is present.
+        """
+        key = version.sort_key
+        epoch, release = key[0], key[1]
+
+        node = self._roots.get(epoch)
+        path: list[tuple[_Node, int]] = []
+        for number in release:
+            if node is None:
+                break
+            path.append((node, number))
+            node = node.children.get(number)
+
+        if node is None or key not in node.versions:
+            raise KeyError(version)
+
+        del node.versions[key]
+        self._len -= 1
+
+        # Remove nodes which no longer lead to any versions.
+        for parent, number in reversed(path):
+            if node.versions or node.children:
+                return
+            del parent.children[number]
+            node = parent
+        if not node.versions and not node.children:
+            del self._roots[epoch]
+
+    def discard(self, version: Version) -> None:
+        """Remove a version equal to `version` if one is present."""
+        try:
+            self.remove(version)
+        except KeyError:
+            pass
+
+    def with_prefix(
+        self, release: int | Iterable[int], *, epoch: int = 0
+    ) -> Iterator[Version]:
+        """Iterate in sorted order over the versions whose release starts with
+        `release`, as matched by ``==release.*`` in PEP 440.
+
+        As in PEP 440, a version is padded with zeros to the length of the
+        prefix, so ``1`` has the prefix ``(1, 0)``.
+
+        :param release: Release number or numbers.
+        :param epoch: Version epoch.
+        """
+        if isinstance(release, int):
+            release = (release,)
+        else:
+            release = tuple(release)
+        for i, number in enumerate(release):
+            _validate_numeric_component(("release", i), number)
+        _validate_numeric_component("epoch", epoch)
+        return self._with_prefix(release, epoch)
+
+    def _with_prefix(self, release: tuple[int, ...], epoch: int) -> Iterator[Version]:
+        node = self._roots.get(epoch)
+        if node is None:
+            return
+
+        for i, number in enumerate(release):
+            # Versions ending here match if the rest of the prefix is zeros.
+            if not any(release[i:]):
+                for key in sorted(node.versions):
+                    yield node.versions[key]
+
+            child = node.children.get(number)
+            if child is None:
+                return
+            node = child
+
+        yield from node
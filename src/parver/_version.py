@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import itertools
-import operator
 import re
 import sys
+import weakref
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import Enum, auto
@@ -21,6 +23,16 @@ if TYPE_CHECKING:
 
 PRE_TAG: tuple[str, ...] = ("alpha", "beta", "preview", "pre", "rc", "a", "b", "c")
 PRE_TAG_STRICT: tuple[str, ...] = ("a", "b", "rc")
+_NORMALIZED_PRE_TAG: dict[str, NormalizedPreTag] = {
+    "alpha": "a",
+    "beta": "b",
+    "preview": "rc",
+    "pre": "rc",
+    "rc": "rc",
+    "a": "a",
+    "b": "b",
+    "c": "rc",
+}
 POST_TAG: tuple[str, ...] = ("post", "rev", "r")
 POST_TAG_STRICT: tuple[str, ...] = ("post",)
 DEV_TAG: tuple[str, ...] = ("dev",)
@@ -32,34 +44,73 @@ T = TypeVar("T")
 _local_version_separators = re.compile(r"[._-]")
 
 
-def check_by(by: int, current: int | None) -> None:
+def check_by(by: int) -> None:
     """Validate the 'by' parameter for bump methods."""
     if not isinstance(by, int):
         msg = "by must be an integer"
         raise TypeError(msg)
 
+
+def check_by_current(by: int, current: int | None) -> None:
+    """Check that the current value can be bumped by `by`."""
     if current is None and by < 0:
         msg = "Cannot bump by negative amount when current value is unset."
         raise ValueError(msg)
 
 
+def check_index(index: int) -> None:
+    """Validate the 'index' parameter for release bump methods."""
+    if not isinstance(index, int):
+        msg = "index must be an integer"
+        raise TypeError(msg)
+
+    if index < 0:
+        msg = "index cannot be negative"
+        raise ValueError(msg)
+
+
+def check_min_length(min_length: int) -> None:
+    """Validate the 'min_length' parameter for truncate."""
+    if not isinstance(min_length, int):
+        msg = "min_length must be an integer"
+        raise TypeError(msg)
+
+    if min_length < 1:
+        msg = "min_length must be positive"
+        raise ValueError(msg)
+
+
 def _normalize_pre_tag(pre_tag: str | None) -> NormalizedPreTag | None:
     """Normalize a pre-release tag to its canonical form."""
     if pre_tag is None:
         return None
 
     pre_tag_lower = pre_tag.lower()
-    if pre_tag_lower == "alpha":
-        return "a"
-    elif pre_tag_lower == "beta":
-        return "b"
-    elif pre_tag_lower in {"c", "pre", "preview"}:
-        return "rc"
-    elif pre_tag_lower in {"a", "b", "rc"}:
-        return cast("NormalizedPreTag", pre_tag_lower)
-
     # Unknown tag - shouldn't happen with valid versions
-    return cast("NormalizedPreTag", pre_tag_lower)
+    return _NORMALIZED_PRE_TAG.get(
+        pre_tag_lower, cast("NormalizedPreTag", pre_tag_lower)
+    )
+
+
+# Local labels such as "cpu" or "cu121" repeat a lot, so parsing them is
+# memoized. The cache is bounded because labels are arbitrary strings.
+@functools.lru_cache(maxsize=1024)
+def _parse_local(local: str) -> tuple[tuple[str | int, ...], str, tuple[Any, ...]]:
+    """Parse a local version string into its parts, its normalized form, and
+    its comparison key.
+    """
+    parts = tuple(
+        part.lower() if not part.isdigit() else int(part)
+        for part in _local_version_separators.split(local)
+    )
+    # The comparison key implements the sorting rules in PEP440.
+    # - Alpha numeric segments sort before numeric segments
+    # - Alpha numeric segments sort lexicographically
+    # - Numeric segments sort numerically
+    # - Shorter versions sort before longer versions when the prefixes
+    #   match exactly
+    key = tuple((i, "") if isinstance(i, int) else (-Infinity, i) for i in parts)
+    return parts, ".".join(map(str, parts)), key
 
 
 @overload
@@ -75,10 +126,7 @@ def _parse_local_version_normalized(local: str | None) -> tuple[str | int, ...]
     Takes a string like abc.1.twelve and turns it into ("abc", 1, "twelve").
     """
     if local is not None:
-        return tuple(
-            part.lower() if not part.isdigit() else int(part)
-            for part in _local_version_separators.split(local)
-        )
+        return _parse_local(local)[0]
 
     return None
 
@@ -88,7 +136,7 @@ def _normalize_local(local: str | None) -> str | None:
     if local is None:
         return None
 
-    return ".".join(map(str, _parse_local_version_normalized(local)))
+    return _parse_local(local)[1]
 
 
 def _cmpkey(
@@ -99,7 +147,7 @@ def _cmpkey(
     post: int | None,
     dev: int | None,
     local: str | None,
-) -> Any:
+) -> tuple[Any, ...]:
     """Create a comparison key for version ordering."""
     # When we compare a release version, we want to compare it with all of the
     # trailing zeros removed. So we'll use a reverse the list, drop all the now
@@ -147,19 +195,75 @@ def _cmpkey(
     else:
         # Versions with a local segment need that segment parsed to implement
         # the sorting rules in PEP440.
-        # - Alpha numeric segments sort before numeric segments
-        # - Alpha numeric segments sort lexicographically
-        # - Numeric segments sort numerically
-        # - Shorter versions sort before longer versions when the prefixes
-        #   match exactly
-        local_key = tuple(
-            (i, "") if isinstance(i, int) else (-Infinity, i)
-            for i in _parse_local_version_normalized(local)
-        )
+        local_key = _parse_local(local)[2]
 
     return epoch, release, pre, post_key, dev_key, local_key
 
 
+class _BoundaryKey(tuple[Any, ...]):
+    """A comparison key which sorts immediately before (side -1) or after
+    (side 1) the keys equal to `key`.
+
+    Since the keys of two unequal versions always have a version between
+    them, there is no key for the next version, so this compares `key` and
+    `side` as if comparison keys had a side of 0. Being a tuple subclass, its
+    reflected comparisons take priority over those of plain keys.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, key: tuple[Any, ...], side: Literal[-1, 1]) -> _BoundaryKey:
+        return super().__new__(cls, (key, side))
+
+    def __repr__(self) -> str:
+        return f"<{'after' if self[1] > 0 else 'before'} {self[0]!r}>"
+
+    def _coerce(self, other: object) -> tuple[Any, ...] | None:
+        if isinstance(other, _BoundaryKey):
+            return other[0], other[1]
+        if isinstance(other, tuple):
+            return other, 0
+        return None
+
+    def __lt__(self, other: object) -> bool:
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return (self[0], self[1]) < o
+
+    def __le__(self, other: object) -> bool:
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return (self[0], self[1]) <= o
+
+    def __eq__(self, other: object) -> bool:
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return (self[0], self[1]) == o
+
+    def __ne__(self, other: object) -> bool:
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return (self[0], self[1]) != o
+
+    def __gt__(self, other: object) -> bool:
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return (self[0], self[1]) > o
+
+    def __ge__(self, other: object) -> bool:
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return (self[0], self[1]) >= o
+
+    __hash__ = tuple.__hash__
+
+
 class ParseError(ValueError):
     """Raised when parsing an invalid version number."""
 
@@ -476,6 +580,8 @@ def _validate_numeric_component(
 ) -> None:
     if allow_implicit and value == IMPLICIT_ZERO:
         return
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return
     # For release validation, use 'release' in error messages
     name = (
         "'release'"
@@ -539,6 +645,68 @@ def _release_target_part(
     return value
 
 
+def _update_init_attrs(d: dict[str, Any], kwargs: dict[str, Any]) -> None:
+    """Update the __init__ arguments `d` of a version with the arguments given
+    to replace().
+    """
+    kwargs = {k: v for k, v in kwargs.items() if v is not UNSET}
+
+    if kwargs.get("post_tag", UNSET) is None:
+        # ensure we don't carry over separators for new implicit post
+        # release. By popping from d, there will still be an error if the
+        # user tries to set them in kwargs
+        d.pop("post_sep1", None)
+        d.pop("post_sep2", None)
+
+    if kwargs.get("post", UNSET) is None:
+        kwargs["post_tag"] = UNSET
+        d.pop("post_sep1", None)
+        d.pop("post_sep2", None)
+
+    if kwargs.get("pre", UNSET) is None:
+        kwargs["pre_tag"] = None
+        d.pop("pre_sep1", None)
+        d.pop("pre_sep2", None)
+
+    if kwargs.get("dev", UNSET) is None:
+        d.pop("dev_sep1", None)
+        d.pop("dev_sep2", None)
+        d.pop("dev_tag", None)
+
+    d.update(kwargs)
+
+
+# The attributes of a version with only a release segment, as set by
+# Version.__init__. Used by Version.from_tuple.
+_RELEASE_ONLY_DEFAULTS: dict[str, Any] = dict(
+    _hash=None,
+    _pre_tag_normalized=None,
+    _release_widths=None,
+    dev=None,
+    dev_implicit=False,
+    dev_sep1=None,
+    dev_sep2=None,
+    dev_tag=None,
+    epoch=0,
+    epoch_implicit=True,
+    local=None,
+    post=None,
+    post_implicit=False,
+    post_sep1=None,
+    post_sep2=None,
+    post_tag=None,
+    pre=None,
+    pre_implicit=False,
+    pre_sep1=None,
+    pre_sep2=None,
+    pre_tag=None,
+    v=None,
+)
+
+# Interned versions, keyed on their exact spelling. See Version.intern.
+_interned: weakref.WeakValueDictionary[str, Version] = weakref.WeakValueDictionary()
+
+
 class Version:
     """
     A PEP 440 version number.
@@ -621,8 +789,12 @@ class Version:
     """
 
     __slots__ = (
+        "__weakref__",
         "_frozen",
+        "_hash",
         "_key",
+        "_pre_tag_normalized",
+        "_release_widths",
         "dev",
         "dev_implicit",
         "dev_sep1",
@@ -646,7 +818,10 @@ class Version:
     )
 
     _frozen: bool
-    _key: Any
+    _hash: int | None
+    _key: tuple[Any, ...]
+    _pre_tag_normalized: NormalizedPreTag | None
+    _release_widths: tuple[int, ...] | None
     v: Literal["v", "V"] | None
     """The leading ``v`` or ``V`` prefix, or ``None`` if it has no prefix."""
 
@@ -749,6 +924,17 @@ class Version:
         _, slots = state
         for name, value in slots.items():
             object.__setattr__(self, name, value)
+        if "_release_widths" not in slots:
+            # Pickled by parver 1.0, which kept zero-padded numbers in
+            # release and did not store the attributes derived from it.
+            object.__setattr__(self, "_release_widths", None)
+            attrs = self._attrs_as_init()
+            object.__setattr__(self, "_frozen", False)
+            self.__init__(**attrs)  # type: ignore[misc]
+            return
+        # String hashes differ between processes, so a cached hash must not
+        # be restored.
+        object.__setattr__(self, "_hash", None)
 
     def __init__(
         self,
@@ -795,12 +981,31 @@ class Version:
         if not isinstance(release, tuple):
             msg = f"release must be an int or iterable of ints (got {release!r})"
             raise TypeError(msg)
-        for i, number in enumerate(release):
-            _validate_numeric_component(("release", i), number)
+        # Most releases are plain non-negative ints, which can be checked in
+        # one pass. Anything else is checked number by number to report the
+        # error.
+        plain = all(type(number) is int and number >= 0 for number in release)
+        if not plain:
+            for i, number in enumerate(release):
+                _validate_numeric_component(("release", i), number)
         if not release:
             msg = "'release' cannot be empty"
             raise ValueError(msg)
+        # Zero padding is rare, so the release is stored as plain integers
+        # and the minimum width of each number is only kept if one of them
+        # is padded.
         self.release = release
+        self._release_widths = None
+        if not plain and any(isinstance(number, ReleaseInt) for number in release):
+            widths = tuple(
+                number.minimum_width if isinstance(number, ReleaseInt) else 1
+                for number in release
+            )
+            self.release = cast(
+                "NonEmptyTuple[int]", tuple(int(number) for number in release)
+            )
+            if any(width > 1 for width in widths):
+                self._release_widths = widths
         if pre is not None:
             _validate_numeric_component("pre", pre, allow_implicit=True)
         if pre_sep1 is not None:
@@ -820,6 +1025,7 @@ class Version:
                 msg = "Must set pre if pre_tag is given."
                 raise ValueError(msg)
         self.pre_tag = pre_tag
+        self._pre_tag_normalized = _normalize_pre_tag(pre_tag)
 
         if pre == IMPLICIT_ZERO:
             self.pre = 0
@@ -970,21 +1176,27 @@ class Version:
         self._key = _cmpkey(
             self.epoch,
             self.release,
-            _normalize_pre_tag(self.pre_tag),
+            self._pre_tag_normalized,
             self.pre,
             self.post,
             self.dev,
             self.local,
         )
+        self._hash = None
         self._frozen = True
 
     @classmethod
-    def parse(cls, version: str, *, strict: bool = False) -> Version:
+    def parse(
+        cls, version: str, *, strict: bool = False, intern: bool = False
+    ) -> Version:
         """
         Parse a version string.
 
         :param version: Version number as defined in PEP 440.
         :param strict: Enable strict parsing of the canonical PEP 440 format.
+        :param intern: Return the shared instance for this spelling, as
+            :meth:`intern` does. Parsing is skipped if a version with exactly
+            this spelling is already interned.
         :raises ParseError: If version is not valid for the given value of `strict`.
 
         .. rubric:: Example
@@ -992,7 +1204,57 @@ class Version:
         >>> Version.parse("1.2a3")
         <Version '1.2a3'>
         """
-        return Parser(version, strict=strict).parse()
+        if not intern:
+            return Parser(version, strict=strict).parse()
+        # Strict mode may reject a spelling that was interned from a
+        # permissive parse, so only permissive parsing can skip the parser.
+        if not strict and (interned := _interned.get(version)) is not None:
+            return interned
+        return Parser(version, strict=strict).parse().intern()
+
+    @classmethod
+    def from_tuple(cls, release: NonEmptyTuple[int]) -> Version:
+        """Create a version with only a release segment from a tuple of
+        integers, without validating it.
+
+        This is faster than ``Version(release=release)`` when constructing
+        many versions from trusted data.
+
+        :param release: A non-empty tuple of non-negative integers. Passing
+            anything else results in an invalid version.
+
+        .. rubric:: Example
+
+        >>> Version.from_tuple((2026, 5, 1))
+        <Version '2026.5.1'>
+        """
+        version = object.__new__(cls)
+        for name, value in _RELEASE_ONLY_DEFAULTS.items():
+            object.__setattr__(version, name, value)
+        object.__setattr__(version, "release", release)
+        key = _cmpkey(0, release, None, None, None, None, None)
+        object.__setattr__(version, "_key", key)
+        object.__setattr__(version, "_frozen", True)
+        return version
+
+    def intern(self) -> Version:
+        """Return the shared instance for versions spelled exactly like this
+        one, making this version the shared instance if there is none.
+
+        Interning saves memory when the same versions are parsed many times.
+        Interned versions are only referenced weakly, so they are not kept
+        alive by the intern table.
+
+        .. rubric:: Example
+
+        >>> a = Version.parse("1.0").intern()
+        >>> b = Version.parse("1.0", intern=True)
+        >>> a is b
+        True
+        >>> a is Version.parse("1.00", intern=True)
+        False
+        """
+        return _interned.setdefault(str(self), self)
 
     def __str__(self) -> str:
         parts: list[str] = []
@@ -1003,7 +1265,15 @@ class Version:
         if not self.epoch_implicit:
             parts.append(f"{self.epoch}!")
 
-        parts.append(".".join(str(x) for x in self.release))
+        if self._release_widths is None:
+            parts.append(".".join(str(x) for x in self.release))
+        else:
+            parts.append(
+                ".".join(
+                    str(x).zfill(width)
+                    for x, width in zip(self.release, self._release_widths)
+                )
+            )
 
         if self.pre_tag is not None:
             if self.pre_sep1:
@@ -1043,31 +1313,177 @@ class Version:
         return f"<{self.__class__.__name__} {str(self)!r}>"
 
     def __hash__(self) -> int:
-        return hash(self._key)
+        value = self._hash
+        if value is None:
+            value = hash(self._key)
+            object.__setattr__(self, "_hash", value)
+        return value
+
+    # The comparison methods are written out individually because they are
+    # called very often, e.g. when sorting. Comparing a version with itself
+    # (or with an interned twin) doesn't need the keys, and versions whose
+    # hashes are both cached and differ can't be equal.
 
     def __lt__(self, other: Any) -> Any:
-        return self._compare(other, operator.lt)
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self is not other and self._key < other._key
 
     def __le__(self, other: Any) -> Any:
-        return self._compare(other, operator.le)
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self is other or self._key <= other._key
 
     def __eq__(self, other: Any) -> Any:
-        return self._compare(other, operator.eq)
+        if self is other:
+            return True
+        if not isinstance(other, Version):
+            return NotImplemented
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
+        return self._key == other._key
 
     def __ge__(self, other: Any) -> Any:
-        return self._compare(other, operator.ge)
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self is other or self._key >= other._key
 
     def __gt__(self, other: Any) -> Any:
-        return self._compare(other, operator.gt)
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self is not other and self._key > other._key
 
     def __ne__(self, other: Any) -> Any:
-        return self._compare(other, operator.ne)
-
-    def _compare(self, other: Any, method: Callable[[Any, Any], bool]) -> Any:
+        if self is other:
+            return False
         if not isinstance(other, Version):
             return NotImplemented
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return True
+        return self._key != other._key
+
+    @property
+    def sort_key(self) -> tuple[Any, ...]:
+        """A key which orders versions as defined by PEP 440, for use with
+        the `key` argument of :func:`sorted` and similar functions.
+
+        For any two versions ``a`` and ``b``, ``a.sort_key < b.sort_key`` if
+        and only if ``a < b``, and ``a.sort_key == b.sort_key`` if and only if
+        ``a == b``. Keys may only be compared with other keys from this
+        property, and their contents are not part of the public API.
+
+        Sorting by this key is faster than sorting versions directly, because
+        the keys are compared without calling :meth:`__lt__`.
+
+        .. rubric:: Example
+
+        >>> Version.parse("1.0").sort_key == Version.parse("1.0.0").sort_key
+        True
+        >>> versions = [Version.parse(v) for v in ["1.0", "1.0rc1", "1.0.dev0"]]
+        >>> sorted(versions, key=lambda v: v.sort_key)
+        [<Version '1.0.dev0'>, <Version '1.0rc1'>, <Version '1.0'>]
+        """
+        return self._key
+
+    def successor_key(self) -> tuple[Any, ...]:
+        """Return a key which sorts after the :attr:`sort_key` of this version
+        and of every version equal to it, but before that of every greater
+        version.
+
+        For any version ``v``, ``v > self`` if and only if
+        ``v.sort_key > self.successor_key()``, so an exclusive lower bound
+        ``> self`` can be used as the inclusive bound ``>= successor_key()``,
+        e.g. with :func:`bisect.bisect_left` on a sorted list of keys.
+
+        The key follows the ordering of the comparison operators, so
+        post-releases and local versions of this version are greater than it.
+        Keys may only be compared with :attr:`sort_key` and other boundary
+        keys.
+
+        .. rubric:: Example
+
+        >>> keys = [Version.parse(v).sort_key for v in ["1.0", "1.0.0+abc", "1.1"]]
+        >>> import bisect
+        >>> bisect.bisect_left(keys, Version.parse("1.0").successor_key())
+        1
+        """
+        return _BoundaryKey(self._key, 1)
+
+    def predecessor_key(self) -> tuple[Any, ...]:
+        """Return a key which sorts before the :attr:`sort_key` of this version
+        and of every version equal to it, but after that of every smaller
+        version.
+
+        For any version ``v``, ``v < self`` if and only if
+        ``v.sort_key < self.predecessor_key()``, so an exclusive upper bound
+        ``< self`` can be used as the inclusive bound
+        ``<= predecessor_key()``. See :meth:`successor_key`.
+
+        .. rubric:: Example
+
+        >>> keys = [Version.parse(v).sort_key for v in ["1.0", "2.0.dev0", "2"]]
+        >>> import bisect
+        >>> bisect.bisect_right(keys, Version.parse("2.0").predecessor_key())
+        2
+        """
+        return _BoundaryKey(self._key, -1)
+
+    def stable_hash(self, bits: int = 64) -> int:
+        """Return a hash of this version which is the same in every process,
+        e.g. to partition versions between workers or machines.
+
+        Unlike :func:`hash`, it does not change between interpreter runs.
+        Versions which are equal have the same stable hash, even if they are
+        spelled differently.
+
+        The hash is computed from the normalized form of the version, with an
+        explicit epoch and trailing zeros removed from the release segment,
+        using BLAKE2b.
+
+        :param bits: Size of the hash in bits. Must be a multiple of 8 between
+            8 and 512.
+        :raises TypeError: `bits` is not an integer.
+        :raises ValueError: `bits` is not a multiple of 8 between 8 and 512.
+
+        .. rubric:: Example
+
+        >>> Version.parse("1.0").stable_hash() == Version.parse("v1.0.0").stable_hash()
+        True
+        >>> Version.parse("1.0").stable_hash(bits=32)
+        2137811
+        """
+        if isinstance(bits, bool) or not isinstance(bits, int):
+            msg = "bits must be an integer"
+            raise TypeError(msg)
+        if bits % 8 or not 8 <= bits <= 512:
+            msg = "bits must be a multiple of 8 between 8 and 512"
+            raise ValueError(msg)
+
+        release = self._key[1] or (0,)
+        parts = [f"{int(self.epoch)}!", ".".join(str(int(x)) for x in release)]
+
+        if self.pre is not None:
+            parts.append(f"{self._pre_tag_normalized}{int(self.pre)}")
+
+        if self.post is not None:
+            parts.append(f".post{int(self.post)}")
+
+        if self.dev is not None:
+            parts.append(f".dev{int(self.dev)}")
+
+        if self.local is not None:
+            parts.append(f"+{_normalize_local(self.local)}")
 
-        return method(self._key, other._key)
+        digest = hashlib.blake2b("".join(parts).encode(), digest_size=bits // 8)
+        return int.from_bytes(digest.digest(), "big")
 
     @property
     def public(self) -> str:
@@ -1088,21 +1504,21 @@ class Version:
         """A boolean value indicating whether this Version instance
         represents an alpha pre-release.
         """
-        return _normalize_pre_tag(self.pre_tag) == "a"
+        return self._pre_tag_normalized == "a"
 
     @property
     def is_beta(self) -> bool:
         """A boolean value indicating whether this Version instance
         represents a beta pre-release.
         """
-        return _normalize_pre_tag(self.pre_tag) == "b"
+        return self._pre_tag_normalized == "b"
 
     @property
     def is_release_candidate(self) -> bool:
         """A boolean value indicating whether this Version instance
         represents a release candidate pre-release.
         """
-        return _normalize_pre_tag(self.pre_tag) == "rc"
+        return self._pre_tag_normalized == "rc"
 
     @property
     def is_postrelease(self) -> bool:
@@ -1118,10 +1534,21 @@ class Version:
         """
         return self.dev is not None
 
+    def _release_parts(self) -> tuple[int, ...]:
+        """Return the release numbers, with zero-padded numbers as ReleaseInt
+        so that their width is kept by __init__.
+        """
+        if self._release_widths is None:
+            return self.release
+        return tuple(
+            x if width == 1 else ReleaseInt(x, width=width)
+            for x, width in zip(self.release, self._release_widths)
+        )
+
     def _attrs_as_init(self) -> dict[str, Any]:
         """Convert current attributes to a dict suitable for __init__."""
         d: dict[str, Any] = dict(
-            release=self.release,
+            release=self._release_parts(),
             v=self.v,
             epoch=IMPLICIT_ZERO if self.epoch_implicit else self.epoch,
             local=self.local,
@@ -1198,69 +1625,21 @@ class Version:
             post_tag=post_tag,
             dev_tag=dev_tag,
         )
-        kwargs = {k: v for k, v in kwargs.items() if v is not UNSET}
         d = self._attrs_as_init()
-
-        if kwargs.get("post_tag", UNSET) is None:
-            # ensure we don't carry over separators for new implicit post
-            # release. By popping from d, there will still be an error if the
-            # user tries to set them in kwargs
-            d.pop("post_sep1", None)
-            d.pop("post_sep2", None)
-
-        if kwargs.get("post", UNSET) is None:
-            kwargs["post_tag"] = UNSET
-            d.pop("post_sep1", None)
-            d.pop("post_sep2", None)
-
-        if kwargs.get("pre", UNSET) is None:
-            kwargs["pre_tag"] = None
-            d.pop("pre_sep1", None)
-            d.pop("pre_sep2", None)
-
-        if kwargs.get("dev", UNSET) is None:
-            d.pop("dev_sep1", None)
-            d.pop("dev_sep2", None)
-            d.pop("dev_tag", None)
-
-        d.update(kwargs)
+        _update_init_attrs(d, kwargs)
         return Version(**d)
 
-    def _set_release(
-        self,
-        index: int,
-        value: int | None = None,
-        bump: bool = True,
-        width: int | None = None,
-    ) -> Version:
-        """Helper method for release-related bump operations."""
-        if not isinstance(index, int):
-            msg = "index must be an integer"
-            raise TypeError(msg)
-
-        if index < 0:
-            msg = "index cannot be negative"
-            raise ValueError(msg)
+    def evolve(self) -> VersionBuilder:
+        """Return a :class:`VersionBuilder` for applying several changes to
+        this version without creating intermediate instances.
 
-        release = list(self.release)
-        new_len = index + 1
-
-        if len(release) < new_len:
-            release.extend(itertools.repeat(0, new_len - len(release)))
-
-        def new_parts(i: int, n: int) -> int:
-            if i < index:
-                return n
-            if i == index:
-                return _release_target_part(n, value=value, width=width)
-            if bump:
-                if isinstance(n, ReleaseInt):
-                    return n.zero_like()
-                return 0
-            return n
+        .. rubric:: Example
 
-        new_release = list(itertools.starmap(new_parts, enumerate(release)))
-        return self.replace(release=new_release)
+        >>> v = Version.parse("1.2.post1+local")
+        >>> v.evolve().bump_release(index=1).bump_pre("rc").replace(local=None).build()
+        <Version '1.3rc0.post1'>
+        """
+        return VersionBuilder(self)
 
     def bump_epoch(self, *, by: int = 1, width: int | None = None) -> Version:
         """Return a new Version instance with the epoch number bumped.
@@ -1278,12 +1657,7 @@ class Version:
         >>> Version.parse("1").bump_epoch(width=2)
         <Version '01!1'>
         """
-        check_by(by, self.epoch)
-
-        epoch = by - 1 if self.epoch is None else self.epoch + by
-        if width is not None:
-            epoch = ReleaseInt(epoch, width=width)
-        return self.replace(epoch=epoch)
+        return self.evolve().bump_epoch(by=by, width=width).build()
 
     def bump_release(self, *, index: int, width: int | None = None) -> Version:
         """Return a new Version instance with the release number bumped at
@@ -1305,7 +1679,7 @@ class Version:
         >>> Version.parse("1.2").bump_release(index=1, width=2)
         <Version '1.03'>
         """
-        return self._set_release(index=index, width=width)
+        return self.evolve().bump_release(index=index, width=width).build()
 
     def bump_release_to(
         self, *, index: int, value: int, width: int | None = None
@@ -1330,7 +1704,8 @@ class Version:
         >>> Version.parse("2027.0").bump_release_to(index=1, value=1, width=2)
         <Version '2027.01'>
         """
-        return self._set_release(index=index, value=value, width=width)
+        builder = self.evolve()
+        return builder.bump_release_to(index=index, value=value, width=width).build()
 
     def set_release(
         self, *, index: int, value: int, width: int | None = None
@@ -1356,7 +1731,8 @@ class Version:
         >>> Version.parse("1").set_release(index=1, value=6, width=2)
         <Version '1.06'>
         """
-        return self._set_release(index=index, value=value, bump=False, width=width)
+        builder = self.evolve()
+        return builder.set_release(index=index, value=value, width=width).build()
 
     def bump_pre(
         self, tag: str | None = None, *, by: int = 1, width: int | None = None
@@ -1380,27 +1756,7 @@ class Version:
         >>> Version.parse("1").bump_pre("b", width=2)
         <Version '1b00'>
         """
-        check_by(by, self.pre)
-
-        pre = by - 1 if self.pre is None else self.pre + by
-        if width is not None:
-            pre = ReleaseInt(pre, width=width)
-
-        if self.pre_tag is None:
-            if tag is None:
-                msg = "Cannot bump without pre_tag. Use .bump_pre('<tag>')"
-                raise ValueError(msg)
-        else:
-            # This is an error because different tags have different meanings
-            if tag is not None and self.pre_tag.lower() != tag.lower():
-                msg = (
-                    f"Cannot bump with pre_tag mismatch ({self.pre_tag} != {tag}). "
-                    f"Use .replace(pre_tag={tag!r})"
-                )
-                raise ValueError(msg)
-            tag = self.pre_tag
-
-        return self.replace(pre=pre, pre_tag=tag)
+        return self.evolve().bump_pre(tag, by=by, width=width).build()
 
     @overload
     def bump_post(
@@ -1436,14 +1792,10 @@ class Version:
         >>> Version.parse("1").bump_post(None, by=2, width=2)
         <Version '1-01'>
         """
-        check_by(by, self.post)
-
-        post = by - 1 if self.post is None else self.post + by
-        if width is not None:
-            post = ReleaseInt(post, width=width)
-        if tag is UNSET and self.post is not None:
-            tag = self.post_tag
-        return self.replace(post=post, post_tag=tag)
+        builder = self.evolve()
+        if isinstance(tag, UnsetType):
+            return builder.bump_post(by=by, width=width).build()
+        return builder.bump_post(tag, by=by, width=width).build()
 
     @overload
     def bump_dev(
@@ -1481,15 +1833,10 @@ class Version:
         >>> Version.parse("1").bump_dev(width=2)
         <Version '1.dev00'>
         """
-        check_by(by, self.dev)
-
-        dev = by - 1 if self.dev is None else self.dev + by
-        if width is not None:
-            dev = ReleaseInt(dev, width=width)
-        if tag is UNSET and self.dev is not None:
-            assert self.dev_tag is not None
-            tag = self.dev_tag
-        return self.replace(dev=dev, dev_tag=tag)
+        builder = self.evolve()
+        if isinstance(tag, UnsetType):
+            return builder.bump_dev(by=by, width=width).build()
+        return builder.bump_dev(tag, by=by, width=width).build()
 
     def normalize(self) -> Version:
         """Return a new Version instance with normalized values.
@@ -1504,7 +1851,7 @@ class Version:
         return Version(
             release=[int(x) for x in self.release],
             epoch=IMPLICIT_ZERO if self.epoch == 0 else int(self.epoch),
-            pre_tag=_normalize_pre_tag(self.pre_tag),
+            pre_tag=self._pre_tag_normalized,
             pre=None if self.pre is None else int(self.pre),
             post=None if self.post is None else int(self.post),
             dev=None if self.dev is None else int(self.dev),
@@ -1539,15 +1886,183 @@ class Version:
         >>> Version.parse("1.0.1").bump_release(index=0).truncate(min_length=2)
         <Version '2.0'>
         """
-        if not isinstance(min_length, int):
-            msg = "min_length must be an integer"
-            raise TypeError(msg)
+        return self.evolve().truncate(min_length=min_length).build()
 
-        if min_length < 1:
-            msg = "min_length must be positive"
-            raise ValueError(msg)
 
-        release = list(self.release)
+class VersionBuilder:
+    """A mutable copy of a :class:`Version`, created by :meth:`Version.evolve`.
+
+    It has the same methods for changing a version as :class:`Version`, with
+    the same arguments and behaviour, but they change the builder in place and
+    return it so that calls can be chained. The changes are only validated by
+    :meth:`build`, so no intermediate :class:`Version` instances are created.
+
+    .. rubric:: Example
+
+    >>> builder = Version.parse("1.2").evolve()
+    >>> builder.bump_release(index=1).bump_pre("rc").bump_dev()
+    <VersionBuilder>
+    >>> builder.build()
+    <Version '1.3rc0.dev0'>
+    """
+
+    __slots__ = ("_attrs",)
+
+    _attrs: dict[str, Any]
+
+    def __init__(self, version: Version) -> None:
+        self._attrs = version._attrs_as_init()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}>"
+
+    def build(self) -> Version:
+        """Return a new Version instance with the changes applied.
+
+        :raises ValueError: The changes result in an invalid version.
+        :raises TypeError: The changes result in an invalid version.
+        """
+        return Version(**self._attrs)
+
+    def _number(self, name: str) -> int | None:
+        value = self._attrs.get(name)
+        if value == IMPLICIT_ZERO:
+            return 0
+        return cast("int | None", value)
+
+    def replace(
+        self,
+        release: int | Iterable[int] | UnsetType = UNSET,
+        v: Literal["v", "V"] | None | UnsetType = UNSET,
+        epoch: ImplicitZero | int | UnsetType = UNSET,
+        pre_tag: str | None | UnsetType = UNSET,
+        pre: ImplicitZero | int | None | UnsetType = UNSET,
+        post: ImplicitZero | int | None | UnsetType = UNSET,
+        dev: ImplicitZero | int | None | UnsetType = UNSET,
+        local: str | None | UnsetType = UNSET,
+        pre_sep1: Separator | None | UnsetType = UNSET,
+        pre_sep2: Separator | None | UnsetType = UNSET,
+        post_sep1: Separator | None | UnsetType = UNSET,
+        post_sep2: Separator | None | UnsetType = UNSET,
+        dev_sep1: Separator | None | UnsetType = UNSET,
+        dev_sep2: Separator | None | UnsetType = UNSET,
+        post_tag: str | None | UnsetType = UNSET,
+        dev_tag: str | None | UnsetType = UNSET,
+    ) -> VersionBuilder:
+        """Like :meth:`Version.replace`."""
+        if (
+            not isinstance(release, (tuple, int, UnsetType))
+            and isinstance(release, Iterable)
+            and not isinstance(release, str)
+        ):
+            # The release may be read by later changes, so an iterator
+            # must not be consumed by the first one.
+            release = tuple(release)
+        kwargs: dict[str, Any] = dict(
+            release=release,
+            v=v,
+            epoch=epoch,
+            pre_tag=pre_tag,
+            pre=pre,
+            post=post,
+            dev=dev,
+            local=local,
+            pre_sep1=pre_sep1,
+            pre_sep2=pre_sep2,
+            post_sep1=post_sep1,
+            post_sep2=post_sep2,
+            dev_sep1=dev_sep1,
+            dev_sep2=dev_sep2,
+            post_tag=post_tag,
+            dev_tag=dev_tag,
+        )
+        _update_init_attrs(self._attrs, kwargs)
+        return self
+
+    # The public methods validate their arguments and then call a private
+    # method to apply the change. bump_many() validates the arguments once
+    # and calls the private methods directly.
+
+    def _set_release(
+        self,
+        index: int,
+        value: int | None = None,
+        bump: bool = True,
+        width: int | None = None,
+    ) -> VersionBuilder:
+        """Helper method for release-related bump operations."""
+        current = self._attrs["release"]
+        release = [current] if isinstance(current, int) else list(current)
+        new_len = index + 1
+
+        if len(release) < new_len:
+            release.extend(itertools.repeat(0, new_len - len(release)))
+
+        def new_parts(i: int, n: int) -> int:
+            if i < index:
+                return n
+            if i == index:
+                return _release_target_part(n, value=value, width=width)
+            if bump:
+                if isinstance(n, ReleaseInt):
+                    return n.zero_like()
+                return 0
+            return n
+
+        new_release = tuple(itertools.starmap(new_parts, enumerate(release)))
+        return self.replace(release=new_release)
+
+    def _bump_number(self, name: str, by: int, width: int | None) -> ReleaseInt | int:
+        current = self._number(name)
+        check_by_current(by, current)
+
+        number = by - 1 if current is None else current + by
+        if width is not None:
+            number = ReleaseInt(number, width=width)
+        return number
+
+    def _bump_epoch(self, by: int, width: int | None) -> VersionBuilder:
+        return self.replace(epoch=self._bump_number("epoch", by, width))
+
+    def _bump_pre(self, tag: str | None, by: int, width: int | None) -> VersionBuilder:
+        pre = self._bump_number("pre", by, width)
+
+        pre_tag = self._attrs.get("pre_tag")
+        if pre_tag is None:
+            if tag is None:
+                msg = "Cannot bump without pre_tag. Use .bump_pre('<tag>')"
+                raise ValueError(msg)
+        else:
+            # This is an error because different tags have different meanings
+            if tag is not None and pre_tag.lower() != tag.lower():
+                msg = (
+                    f"Cannot bump with pre_tag mismatch ({pre_tag} != {tag}). "
+                    f"Use .replace(pre_tag={tag!r})"
+                )
+                raise ValueError(msg)
+            tag = pre_tag
+
+        return self.replace(pre=pre, pre_tag=tag)
+
+    def _bump_post(
+        self, tag: str | None | UnsetType, by: int, width: int | None
+    ) -> VersionBuilder:
+        post = self._bump_number("post", by, width)
+        if tag is UNSET and self._attrs.get("post") is not None:
+            tag = self._attrs.get("post_tag", UNSET)
+        return self.replace(post=post, post_tag=tag)
+
+    def _bump_dev(
+        self, tag: str | UnsetType, by: int, width: int | None
+    ) -> VersionBuilder:
+        dev = self._bump_number("dev", by, width)
+        if tag is UNSET and self._attrs.get("dev") is not None:
+            tag = self._attrs.get("dev_tag", UNSET)
+        return self.replace(dev=dev, dev_tag=tag)
+
+    def _truncate(self, min_length: int) -> VersionBuilder:
+        current = self._attrs["release"]
+        release = [current] if isinstance(current, int) else list(current)
         if len(release) < min_length:
             release.extend(itertools.repeat(0, min_length - len(release)))
 
@@ -1555,7 +2070,81 @@ class Version:
             last((i for i, n in enumerate(release) if n), default=0),
             min_length - 1,
         )
-        return self.replace(release=release[: last_nonzero + 1])
+        return self.replace(release=tuple(release[: last_nonzero + 1]))
+
+    def bump_epoch(self, *, by: int = 1, width: int | None = None) -> VersionBuilder:
+        """Like :meth:`Version.bump_epoch`."""
+        check_by(by)
+        return self._bump_epoch(by, width)
+
+    def bump_release(self, *, index: int, width: int | None = None) -> VersionBuilder:
+        """Like :meth:`Version.bump_release`."""
+        check_index(index)
+        return self._set_release(index, width=width)
+
+    def bump_release_to(
+        self, *, index: int, value: int, width: int | None = None
+    ) -> VersionBuilder:
+        """Like :meth:`Version.bump_release_to`."""
+        check_index(index)
+        return self._set_release(index, value, width=width)
+
+    def set_release(
+        self, *, index: int, value: int, width: int | None = None
+    ) -> VersionBuilder:
+        """Like :meth:`Version.set_release`."""
+        check_index(index)
+        return self._set_release(index, value, bump=False, width=width)
+
+    def bump_pre(
+        self, tag: str | None = None, *, by: int = 1, width: int | None = None
+    ) -> VersionBuilder:
+        """Like :meth:`Version.bump_pre`."""
+        check_by(by)
+        return self._bump_pre(tag, by, width)
+
+    @overload
+    def bump_post(
+        self, tag: str | None, *, by: int = 1, width: int | None = None
+    ) -> VersionBuilder: ...
+
+    @overload
+    def bump_post(self, *, by: int = 1, width: int | None = None) -> VersionBuilder: ...
+
+    def bump_post(
+        self,
+        tag: str | None | UnsetType = UNSET,
+        *,
+        by: int = 1,
+        width: int | None = None,
+    ) -> VersionBuilder:
+        """Like :meth:`Version.bump_post`."""
+        check_by(by)
+        return self._bump_post(tag, by, width)
+
+    @overload
+    def bump_dev(
+        self, tag: str, *, by: int = 1, width: int | None = None
+    ) -> VersionBuilder: ...
+
+    @overload
+    def bump_dev(self, *, by: int = 1, width: int | None = None) -> VersionBuilder: ...
+
+    def bump_dev(
+        self,
+        tag: str | UnsetType = UNSET,
+        *,
+        by: int = 1,
+        width: int | None = None,
+    ) -> VersionBuilder:
+        """Like :meth:`Version.bump_dev`."""
+        check_by(by)
+        return self._bump_dev(tag, by, width)
+
+    def truncate(self, *, min_length: int = 1) -> VersionBuilder:
+        """Like :meth:`Version.truncate`."""
+        check_min_length(min_length)
+        return self._truncate(min_length)
 
 
 def is_ascii_digit(c: str) -> bool:
@@ -1612,6 +2201,13 @@ class _Cursor:
         assert 0 <= self.start <= self.index <= self.end <= len(self.text)
         self.text_lower = self.text.lower()
 
+    def load(self, text: str) -> None:
+        """Start over with new text."""
+        self.text = text
+        self.index = self.start = 0
+        self.end = len(text)
+        self.text_lower = text.lower()
+
     def is_done(self) -> bool:
         return self.index >= self.end
 
@@ -1676,106 +2272,74 @@ class _CursorCheckpoint:
             self.cursor.reset(self.index)
 
 
+_Expected: TypeAlias = "str | Iterable[str] | Callable[[], Iterable[str]]"
+
+
 @dataclass(slots=True)
 class _ParseDiagnostics:
-    index: int = -1
-    expected: tuple[str, ...] = ()
+    """Remembers the furthest position where the parser gave up on a segment.
 
-    def expect(self, index: int, expected: str | Iterable[str]) -> None:
-        if isinstance(expected, str):
-            expected = (expected,)
+    Successful parses can pass through such positions, so only the position
+    and what to expect there are recorded. Expectations may be given as a
+    callable so that they are only computed if an error is reported.
+    """
+
+    index: int = -1
+    pending: tuple[_Expected, ...] = ()
 
+    def expect(self, index: int, expected: _Expected) -> None:
         if index > self.index:
             self.index = index
-            self.expected = _dedupe_ordered(expected)
+            self.pending = (expected,)
         elif index == self.index:
-            self.expected = _dedupe_ordered((*self.expected, *expected))
+            self.pending = (*self.pending, expected)
+
+    @property
+    def expected(self) -> tuple[str, ...]:
+        items: list[str] = []
+        for expected in self.pending:
+            if callable(expected):
+                expected = expected()
+            if isinstance(expected, str):
+                items.append(expected)
+            else:
+                items.extend(expected)
+        return _dedupe_ordered(items)
+
+    def clear(self) -> None:
+        self.index = -1
+        self.pending = ()
 
     def error(self, version: str) -> UnexpectedInputError | None:
-        if self.index < 0 or not self.expected:
+        if self.index < 0:
+            return None
+        expected = self.expected
+        if not expected:
             return None
         return UnexpectedInputError(
             version=version,
             index=self.index,
-            expected=self.expected,
+            expected=expected,
         )
 
 
-@dataclass(slots=True)
-class _PreSegment:
-    tag: str
-    number: int
-    sep_before: Separator | None = None
-    sep_after_tag: Separator | None = None
-    implicit_number: bool = False
+# (tag, number, separator before tag, separator after tag) for a pre, post,
+# or dev segment. The number is IMPLICIT_ZERO if it was omitted.
+_Segment: TypeAlias = (
+    "tuple[str | None, ImplicitZero | int, Separator | None, Separator | None]"
+)
 
 
-@dataclass(slots=True)
-class _PostSegment:
-    number: int
-    tag: str | None = "post"
-    sep_before: Separator | None = None
-    sep_after_tag: Separator | None = None
-    implicit_number: bool = False
-
-
-@dataclass(slots=True)
-class _DevSegment:
-    number: int
-    tag: str | None = None
-    sep_before: Separator | None = None
-    sep_after_tag: Separator | None = None
-    implicit_number: bool = False
-
-
-SegmentT = TypeVar("SegmentT", _PreSegment, _PostSegment, _DevSegment)
-
-
-@dataclass(slots=True)
-class _ParsedVersion:
-    release: Iterable[int]
-    v: Literal["v", "V"] | None = None
-    epoch: int = 0
-    epoch_implicit: bool = True
-    pre: _PreSegment | None = None
-    post: _PostSegment | None = None
-    dev: _DevSegment | None = None
-    local: str | None = None
-
-    def into_version(self) -> Version:
-        kwargs: dict[str, Any] = dict(
-            v=self.v,
-            epoch=IMPLICIT_ZERO if self.epoch_implicit else self.epoch,
-            release=self.release,
-            local=self.local,
-        )
-
-        if self.pre is not None:
-            kwargs["pre_sep1"] = self.pre.sep_before
-            kwargs["pre_tag"] = self.pre.tag
-            kwargs["pre_sep2"] = self.pre.sep_after_tag
-            kwargs["pre"] = (
-                IMPLICIT_ZERO if self.pre.implicit_number else self.pre.number
-            )
-
-        if self.post is not None:
-            kwargs["post"] = (
-                IMPLICIT_ZERO if self.post.implicit_number else self.post.number
-            )
-            kwargs["post_tag"] = self.post.tag
-            if self.post.tag is not None:
-                kwargs["post_sep1"] = self.post.sep_before
-                kwargs["post_sep2"] = self.post.sep_after_tag
-
-        if self.dev is not None:
-            kwargs["dev"] = (
-                IMPLICIT_ZERO if self.dev.implicit_number else self.dev.number
-            )
-            kwargs["dev_tag"] = self.dev.tag
-            kwargs["dev_sep1"] = self.dev.sep_before
-            kwargs["dev_sep2"] = self.dev.sep_after_tag
-
-        return Version(**kwargs)
+# (v, epoch, release, pre, post, dev, local) for a whole version.
+_Segments: TypeAlias = """tuple[
+    Literal["v", "V"] | None,
+    ImplicitZero | int,
+    list[int],
+    _Segment | None,
+    _Segment | None,
+    _Segment | None,
+    str | None,
+]"""
 
 
 class _SegmentKind(Enum):
@@ -1811,14 +2375,23 @@ class Parser:
 
     In permissive mode it preserves original spelling and accepts the broader
     set of PEP 440 spellings. In strict mode it enforces the canonical form.
+
+    A parser may be reused for many versions by passing each one to
+    :meth:`parse`, which avoids allocating parser state for every version.
     """
 
-    def __init__(self, version: str, *, strict: bool = False) -> None:
+    def __init__(self, version: str = "", *, strict: bool = False) -> None:
         self.strict = strict
         self.version = version
         self.cursor = _Cursor(self.version)
         self.diagnostics = _ParseDiagnostics()
 
+    def reset(self, version: str) -> None:
+        """Prepare the parser to parse `version`."""
+        self.version = version
+        self.cursor.load(version)
+        self.diagnostics.clear()
+
     @property
     def allowed_separators(self) -> tuple[Separator, ...]:
         return SEPARATOR_STRICT if self.strict else SEPARATOR
@@ -1831,33 +2404,110 @@ class Parser:
     def post_tags(self) -> tuple[str, ...]:
         return POST_TAG_STRICT if self.strict else POST_TAG
 
-    def parse(self) -> Version:
+    def parse(self, version: str | None = None) -> Version:
+        """Parse `version`, or the version given to :meth:`reset` or the
+        initialiser if it is omitted.
+        """
+        if version is not None:
+            self.reset(version)
+        return self.build(self.parse_all())
+
+    def validate(self, version: str | None = None) -> None:
+        """Like :meth:`parse`, but only check that the version is valid
+        without constructing a :class:`Version`.
+
+        :raises ParseError: If the version is not valid.
+        """
+        if version is not None:
+            self.reset(version)
+        self.parse_all()
+
+    def parse_all(self) -> _Segments:
+        self.skip_surrounding_whitespace()
+        segments = self.parse_segments()
         self.skip_surrounding_whitespace()
+        self.finish(segments)
+        return segments
+
+    def parse_prefix(self, start: int = 0) -> tuple[Version, int] | None:
+        """Parse the longest version starting at `start`, ignoring whatever
+        follows it.
+
+        Returns the version and the index where it ends, or `None` if no
+        version starts at `start`.
+        """
+        end = len(self.version)
+        while end > start:
+            self.cursor.end = end
+            self.cursor.start = self.cursor.index = start
+            self.diagnostics.clear()
+            try:
+                segments = self.parse_segments()
+            except ParseError:
+                # Nothing at or beyond the failure point can be part of the
+                # version, so try again with the input cut short.
+                end = min(self.cursor.index, end - 1)
+                continue
+            return self.build(segments), self.cursor.index
+        return None
+
+    def parse_segments(self) -> _Segments:
         v = self.parse_v_prefix()
         epoch, epoch_implicit, release = self.parse_epoch_and_release()
-        pre = self.parse_pre()
-        post = self.parse_post()
-        dev = self.parse_dev()
-        local = self.parse_local()
-        self.skip_surrounding_whitespace()
-        self.finish(
-            expected=self.expected_after_segments(pre, post, dev, local),
-            allow_non_strict_pre_tag=pre is None
-            and post is None
-            and dev is None
-            and local is None,
+        return (
+            v,
+            IMPLICIT_ZERO if epoch_implicit else epoch,
+            release,
+            self.parse_pre(),
+            self.parse_post(),
+            self.parse_dev(),
+            self.parse_local(),
         )
 
-        return _ParsedVersion(
+    def build(self, segments: _Segments) -> Version:
+        v, epoch, release, pre, post, dev, local = segments
+
+        pre_tag: str | None = None
+        pre_number: ImplicitZero | int | None = None
+        pre_sep1: Separator | None = None
+        pre_sep2: Separator | None = None
+        if pre is not None:
+            pre_tag, pre_number, pre_sep1, pre_sep2 = pre
+
+        post_tag: str | None | UnsetType = UNSET
+        post_number: ImplicitZero | int | None = None
+        post_sep1: Separator | None | UnsetType = UNSET
+        post_sep2: Separator | None | UnsetType = UNSET
+        if post is not None:
+            post_tag, post_number, sep1, sep2 = post
+            if post_tag is not None:
+                post_sep1, post_sep2 = sep1, sep2
+
+        dev_tag: str | None = None
+        dev_number: ImplicitZero | int | None = None
+        dev_sep1: Separator | None | UnsetType = UNSET
+        dev_sep2: Separator | None | UnsetType = UNSET
+        if dev is not None:
+            dev_tag, dev_number, dev_sep1, dev_sep2 = dev
+
+        return Version(
             v=v,
             epoch=epoch,
-            epoch_implicit=epoch_implicit,
             release=release,
-            pre=pre,
-            post=post,
-            dev=dev,
+            pre_sep1=pre_sep1,
+            pre_tag=pre_tag,
+            pre_sep2=pre_sep2,
+            pre=pre_number,
+            post_sep1=post_sep1,
+            post_tag=post_tag,
+            post_sep2=post_sep2,
+            post=post_number,
+            dev_sep1=dev_sep1,
+            dev_tag=dev_tag,
+            dev_sep2=dev_sep2,
+            dev=dev_number,
             local=local,
-        ).into_version()
+        )
 
     def skip_surrounding_whitespace(self) -> None:
         self.cursor.take_while(str.isspace)
@@ -1923,7 +2573,7 @@ class Parser:
                     if not self.separator_can_start_following_segment():
                         self.diagnostics.expect(
                             self.cursor.index,
-                            self.expected_after_release_separator(),
+                            self.expected_after_release_separator,
                         )
                     break
                 attempt.commit()
@@ -1937,12 +2587,12 @@ class Parser:
         if self.strict:
             _validate_strict_number(digits, context)
             return int(digits)
-        if digits.startswith("0"):
+        if len(digits) > 1 and digits.startswith("0"):
             return ReleaseInt(digits)
         else:
             return int(digits)
 
-    def parse_pre(self) -> _PreSegment | None:
+    def parse_pre(self) -> _Segment | None:
         return self.parse_segment(
             kind=_SegmentKind.PRE,
             tags=self.pre_tags,
@@ -1950,17 +2600,16 @@ class Parser:
             allow_leading_separator=not self.strict,
             allow_number_separator=not self.strict,
             allow_implicit_number=not self.strict,
-            segment_type=_PreSegment,
         )
 
-    def parse_post(self) -> _PostSegment | None:
+    def parse_post(self) -> _Segment | None:
         if not self.strict:
             with self.cursor.checkpoint() as attempt:
                 if self.cursor.match("-") is not None:
                     number = self.parse_number("post-release")
                     if number is not None:
                         attempt.commit()
-                        return _PostSegment(tag=None, number=number)
+                        return None, number, None, None
 
         return self.parse_segment(
             kind=_SegmentKind.POST,
@@ -1970,10 +2619,9 @@ class Parser:
             require_leading_separator=self.strict,
             allow_number_separator=not self.strict,
             allow_implicit_number=not self.strict,
-            segment_type=_PostSegment,
         )
 
-    def parse_dev(self) -> _DevSegment | None:
+    def parse_dev(self) -> _Segment | None:
         return self.parse_segment(
             kind=_SegmentKind.DEV,
             tags=("dev",),
@@ -1982,7 +2630,6 @@ class Parser:
             require_leading_separator=self.strict,
             allow_number_separator=not self.strict,
             allow_implicit_number=not self.strict,
-            segment_type=_DevSegment,
         )
 
     def parse_local(self) -> str | None:
@@ -2030,8 +2677,7 @@ class Parser:
         require_leading_separator: bool = False,
         allow_number_separator: bool = False,
         allow_implicit_number: bool = False,
-        segment_type: type[SegmentT],
-    ) -> SegmentT | None:
+    ) -> _Segment | None:
         with self.cursor.checkpoint() as attempt:
             sep_before = None
             if allow_leading_separator or require_leading_separator:
@@ -2058,8 +2704,7 @@ class Parser:
                     sep_after_tag = candidate_sep_after_tag
                     number_attempt.commit()
 
-            implicit_number = number is None
-            if implicit_number:
+            if number is None:
                 if not allow_implicit_number:
                     if (
                         self.strict
@@ -2087,16 +2732,13 @@ class Parser:
                         version=self.version,
                         index=self.cursor.index,
                     )
-                number = 0
-            assert number is not None
 
             attempt.commit()
-            return segment_type(
-                tag=tag,
-                number=number,
-                sep_before=sep_before,
-                sep_after_tag=sep_after_tag,
-                implicit_number=implicit_number,
+            return (
+                tag,
+                IMPLICIT_ZERO if number is None else number,
+                sep_before,
+                sep_after_tag,
             )
 
     def match_tags(self, tags: tuple[str, ...]) -> str | None:
@@ -2397,13 +3039,8 @@ class Parser:
                 return self.version[index : index + len(tag)]
         return None
 
-    def expected_after_segments(
-        self,
-        pre: _PreSegment | None,
-        post: _PostSegment | None,
-        dev: _DevSegment | None,
-        local: str | None,
-    ) -> tuple[str, ...]:
+    def expected_after_segments(self, segments: _Segments) -> tuple[str, ...]:
+        _, _, _, pre, post, dev, local = segments
         if local is not None:
             return ("end of version",)
         if dev is not None:
@@ -2447,24 +3084,22 @@ class Parser:
     def local_segment_expected(self) -> str:
         return "a local version segment ('+')"
 
-    def finish(
-        self,
-        *,
-        expected: Iterable[str],
-        allow_non_strict_pre_tag: bool,
-    ) -> None:
-        if not self.cursor.is_done():
+    def finish(self, segments: _Segments) -> None:
+        """Raise an error for input left over after parsing `segments`."""
+        if self.cursor.is_done():
+            return
+        if self.diagnostics.index >= self.cursor.index:
             diagnostic = self.diagnostics.error(self.version)
-            if diagnostic is not None and diagnostic.index >= self.cursor.index:
+            if diagnostic is not None:
                 raise diagnostic
-            if allow_non_strict_pre_tag:
-                non_strict_error = self.non_strict_segment_error_at_cursor(
-                    after_release_separator=False,
-                )
-                if non_strict_error is not None:
-                    raise non_strict_error
-            raise UnexpectedInputError(
-                version=self.version,
-                index=self.cursor.index,
-                expected=expected,
+        if segments[3:] == (None, None, None, None):
+            non_strict_error = self.non_strict_segment_error_at_cursor(
+                after_release_separator=False,
             )
+            if non_strict_error is not None:
+                raise non_strict_error
+        raise UnexpectedInputError(
+            version=self.version,
+            index=self.cursor.index,
+            expected=self.expected_after_segments(segments),
+        )
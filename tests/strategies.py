@@ -181,6 +181,10 @@ def version_strategy(draw, strict=False):
     return Version.parse(draw(version_string(strict=strict)))
 
 
+def parse_all(versions):
+    return [Version.parse(v) for v in versions]
+
+
 # The unmodified regex from PEP 440
 version_pattern = r"""
     v?
@@ -0,0 +1,80 @@
+import asyncio
+
+import pretend
+import pytest
+
+from parver import ParseError, aparse_lines
+
+
+async def _parse(data, **kwargs):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return [str(v) async for v in aparse_lines(reader, **kwargs)]
+
+
+async def _lines(lines):
+    for line in lines:
+        yield line
+
+
+def test_aparse_lines():
+    data = b"1.0\n\n  v2.0rc1  \r\n3.0.post1"
+
+    assert asyncio.run(_parse(data)) == ["1.0", "v2.0rc1", "3.0.post1"]
+
+
+def test_aparse_lines_str():
+    async def parse():
+        return [str(v) async for v in aparse_lines(_lines(["1.0\n", "2\n"]))]
+
+    assert asyncio.run(parse()) == ["1.0", "2"]
+
+
+def test_aparse_lines_invalid():
+    with pytest.raises(ParseError):
+        asyncio.run(_parse(b"1.0\nfoo\n"))
+
+    with pytest.raises(ParseError):
+        asyncio.run(_parse(b"1.0\nv2\n", strict=True))
+
+    data = b"1.0\nfoo\nv2\n3\n"
+    assert asyncio.run(_parse(data, strict=True, skip_invalid=True)) == ["1.0", "3"]
+
+
+def test_aparse_lines_invalid_utf8():
+    data = b"1.0\n2.0\xff\n3\n"
+
+    with pytest.raises(UnicodeDecodeError):
+        asyncio.run(_parse(data))
+
+    assert asyncio.run(_parse(data, skip_invalid=True)) == ["1.0", "3"]
+
+
+def test_aparse_lines_yields_control(monkeypatch):
+    async def sleep(delay):
+        pass
+
+    sleep = pretend.call_recorder(sleep)
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    asyncio.run(_parse(b"1\n" * 10, batch_size=3))
+
+    assert sleep.calls == [pretend.call(0)] * 3
+
+
+@pytest.mark.parametrize(
+    ("batch_size", "exc"),
+    [
+        ("1", TypeError),
+        (True, TypeError),
+        (0, ValueError),
+    ],
+)
+def test_aparse_lines_batch_size_error(batch_size, exc):
+    async def lines():
+        pytest.fail("the stream was read before checking batch_size")
+        yield
+
+    with pytest.raises(exc, match="batch_size"):
+        aparse_lines(lines(), batch_size=batch_size)
@@ -0,0 +1,67 @@
+import pytest
+
+from parver import Version, bump_many
+
+VERSIONS = ["1", "1.2", "2026.04.09", "1.0a1", "1.0rc2.post1", "1.0.dev3", "1-4"]
+
+
+@pytest.mark.parametrize(
+    ("op", "kwargs"),
+    [
+        ("bump_epoch", {}),
+        ("bump_epoch", dict(by=2, width=2)),
+        ("bump_release", dict(index=0)),
+        ("bump_release", dict(index=2, width=2)),
+        ("bump_release_to", dict(index=1, value=5)),
+        ("set_release", dict(index=3, value=1)),
+        ("bump_post", {}),
+        ("bump_post", dict(tag="rev", by=3)),
+        ("bump_post", dict(tag=None)),
+        ("bump_dev", {}),
+        ("bump_dev", dict(width=3)),
+        ("truncate", {}),
+        ("truncate", dict(min_length=3)),
+    ],
+)
+def test_bump_many(op, kwargs):
+    versions = [Version.parse(v) for v in VERSIONS]
+    expected = [getattr(v, op)(**kwargs) for v in versions]
+
+    result = bump_many(versions, op, **kwargs)
+
+    assert list(map(str, result)) == list(map(str, expected))
+
+
+def test_bump_many_pre():
+    versions = [Version.parse("1.0"), Version.parse("2.0rc1")]
+
+    assert list(map(str, bump_many(versions, "bump_pre", tag="rc"))) == [
+        "1.0rc0",
+        "2.0rc2",
+    ]
+
+    with pytest.raises(ValueError, match="pre_tag mismatch"):
+        bump_many(versions, "bump_pre", tag="a")
+
+
+@pytest.mark.parametrize(
+    ("op", "kwargs", "exc", "match"),
+    [
+        ("bump", {}, ValueError, "op must be one of"),
+        ("normalize", {}, ValueError, "op must be one of"),
+        ("bump_release", {}, TypeError, "index"),
+        ("bump_release", dict(index=0, by=1), TypeError, "by"),
+        ("bump_release", dict(index="1"), TypeError, "index must be an integer"),
+        ("bump_release", dict(index=-1), ValueError, "index cannot be negative"),
+        ("bump_epoch", dict(by=1.5), TypeError, "by must be an integer"),
+        ("bump_dev", dict(width=0), ValueError, "width must be positive"),
+        ("truncate", dict(min_length=0), ValueError, "min_length must be positive"),
+    ],
+)
+def test_bump_many_validates_arguments_first(op, kwargs, exc, match):
+    def versions():
+        pytest.fail("versions were consumed before validating arguments")
+        yield
+
+    with pytest.raises(exc, match=match):
+        bump_many(versions(), op, **kwargs)
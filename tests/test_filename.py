@@ -0,0 +1,83 @@
+import pickle
+
+import pytest
+
+from parver import (
+    InvalidFilenameError,
+    ParseError,
+    StrictParseError,
+    version_from_filename,
+    versions_from_filenames,
+)
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("pkg-1.2.3-py3-none-any.whl", "1.2.3"),
+        ("pkg-1.2.3-1-cp312-cp312-manylinux_2_17_x86_64.whl", "1.2.3"),
+        ("some_pkg-1!2.0rc1+cpu-py3-none-any.whl", "1!2.0rc1+cpu"),
+        ("pkg-1.2.3.tar.gz", "1.2.3"),
+        ("legacy-name-1.0.post1.zip", "1.0.post1"),
+        ("pkg-2026.05.tar.bz2", "2026.05"),
+        ("pkg-1.0.tar.xz", "1.0"),
+        ("pkg-1.0.tgz", "1.0"),
+    ],
+)
+def test_version_from_filename(filename, expected):
+    assert str(version_from_filename(filename)) == expected
+
+
+@pytest.mark.parametrize(
+    ("filename", "reason"),
+    [
+        ("pkg-1.0.exe", "unknown file extension"),
+        ("pkg-1.0-any.whl", "wrong number of parts"),
+        ("pkg-1.0-1-2-py3-none-any.whl", "wrong number of parts"),
+        ("pkg.tar.gz", "missing version"),
+    ],
+)
+def test_version_from_filename_invalid(filename, reason):
+    with pytest.raises(InvalidFilenameError) as excinfo:
+        version_from_filename(filename)
+
+    assert excinfo.value.filename == filename
+    assert excinfo.value.reason == reason
+    assert str(excinfo.value) == (
+        f"Invalid distribution filename {filename!r}: {reason}"
+    )
+
+
+def test_version_from_filename_strict():
+    with pytest.raises(StrictParseError):
+        version_from_filename("pkg-1.02.tar.gz", strict=True)
+
+    with pytest.raises(ParseError):
+        version_from_filename("pkg-foo.tar.gz")
+
+
+def test_invalid_filename_error_roundtrips_with_pickle():
+    error = InvalidFilenameError("pkg.tar.gz", "missing version")
+
+    reloaded = pickle.loads(pickle.dumps(error))
+
+    assert type(reloaded) is InvalidFilenameError
+    assert reloaded.__dict__ == error.__dict__
+
+
+def test_versions_from_filenames():
+    filenames = ["a-1.0.tar.gz", "b-2.0-py3-none-any.whl", "c-03.zip"]
+
+    versions = list(versions_from_filenames(filenames))
+
+    assert [str(v) for v in versions] == ["1.0", "2.0", "03"]
+
+
+def test_versions_from_filenames_errors():
+    filenames = ["a-1.0.tar.gz", "b.txt", "c-x.zip", "d-03.zip"]
+
+    with pytest.raises(InvalidFilenameError):
+        list(versions_from_filenames(filenames))
+
+    versions = versions_from_filenames(filenames, strict=True, skip_invalid=True)
+    assert [str(v) for v in versions] == ["1.0"]
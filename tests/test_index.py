@@ -0,0 +1,166 @@
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis.strategies import booleans, builds, lists, none, one_of
+
+from parver import RangeIndex, Version, VersionIndex, VersionRange
+
+from .strategies import parse_all, version_strategy
+
+
+def test_version_index():
+    versions = parse_all(["2.0", "1.0", "1.5", "1.5.0", "1.5.post1", "2.1"])
+    index = VersionIndex(versions)
+
+    assert len(index) == 6
+    assert repr(index) == "<VersionIndex size=6>"
+    assert list(map(str, index)) == ["1.0", "1.5", "1.5.0", "1.5.post1", "2.0", "2.1"]
+    assert Version.parse("1.5.0.0") in index
+    assert Version.parse("1.6") not in index
+    assert "1.5" not in index
+
+
+@pytest.mark.parametrize(
+    ("lower", "upper", "kwargs", "expected"),
+    [
+        (None, None, {}, range(0, 6)),
+        ("1.5", None, {}, range(1, 6)),
+        ("1.5", None, dict(include_lower=False), range(3, 6)),
+        (None, "2", {}, range(0, 4)),
+        (None, "2", dict(include_upper=True), range(0, 5)),
+        ("1.5", "1.5", {}, range(1, 1)),
+        ("1.5", "1.5", dict(include_upper=True), range(1, 3)),
+        ("2", "1", {}, range(4, 4)),
+        ("0.1", "0.2", {}, range(0, 0)),
+        ("3", None, {}, range(6, 6)),
+    ],
+)
+def test_span(lower, upper, kwargs, expected):
+    index = VersionIndex(parse_all(["1.0", "1.5", "1.5.0", "1.5.post1", "2.0", "2.1"]))
+    lower = lower and Version.parse(lower)
+    upper = upper and Version.parse(upper)
+
+    span = index.span(lower, upper, **kwargs)
+
+    assert span == expected
+    assert index.between(lower, upper, **kwargs) == list(
+        index.versions[expected.start : expected.stop]
+    )
+
+
+@given(
+    lists(version_strategy()),
+    one_of(none(), version_strategy()),
+    one_of(none(), version_strategy()),
+    booleans(),
+    booleans(),
+)
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_between_matches_scan(versions, lower, upper, include_lower, include_upper):
+    index = VersionIndex(versions)
+
+    def matches(v):
+        if lower is not None and (v < lower or (v == lower and not include_lower)):
+            return False
+        if upper is not None and (v > upper or (v == upper and not include_upper)):
+            return False
+        return True
+
+    expected = [v for v in sorted(versions) if matches(v)]
+    result = index.between(
+        lower, upper, include_lower=include_lower, include_upper=include_upper
+    )
+
+    assert list(map(id, result)) == list(map(id, expected))
+
+
+version_ranges = builds(
+    VersionRange,
+    one_of(none(), version_strategy()),
+    one_of(none(), version_strategy()),
+    booleans(),
+    booleans(),
+)
+
+
+def scan_range(version_range, version):
+    lower = version_range.lower
+    upper = version_range.upper
+    if lower is not None:
+        if version < lower or (version == lower and not version_range.include_lower):
+            return False
+    if upper is not None:
+        if version > upper or (version == upper and not version_range.include_upper):
+            return False
+    return True
+
+
+@pytest.mark.parametrize(
+    ("version_range", "version", "expected"),
+    [
+        (VersionRange(), "1.0", True),
+        (VersionRange(Version.parse("1.0")), "1.0.0", True),
+        (VersionRange(Version.parse("1.0"), include_lower=False), "1.0.0", False),
+        (VersionRange(Version.parse("1.0"), include_lower=False), "1.0.post0", True),
+        (VersionRange(Version.parse("1.0"), include_lower=False), "1.0+local", True),
+        (VersionRange(upper=Version.parse("2")), "2.0", False),
+        (VersionRange(upper=Version.parse("2")), "2.0rc1", True),
+        (VersionRange(upper=Version.parse("2"), include_upper=True), "2.0", True),
+    ],
+)
+def test_version_range_contains(version_range, version, expected):
+    assert (Version.parse(version) in version_range) is expected
+
+
+def test_version_range_contains_non_version():
+    assert "1.0" not in VersionRange()
+
+
+def test_range_index():
+    v = Version.parse
+    ranges = [
+        VersionRange(v("1.0"), v("2.0")),
+        VersionRange(v("1.5"), include_lower=False),
+        VersionRange(upper=v("1.5"), include_upper=True),
+        VersionRange(v("3"), v("1")),
+        VersionRange(v("1.5"), v("1.5"), include_upper=True),
+        VersionRange(v("1.5"), v("1.5")),
+    ]
+    index = RangeIndex(ranges)
+
+    assert len(index) == 6
+    assert repr(index) == "<RangeIndex size=6>"
+    assert index.ranges == tuple(ranges)
+    assert index.containing(v("0.1")) == [2]
+    assert index.containing(v("1.5.0")) == [0, 2, 4]
+    assert index.containing(v("1.5.post1")) == [0, 1]
+    assert index.containing(v("2.0")) == [1]
+    assert RangeIndex([]).containing(v("1")) == []
+
+
+@given(lists(version_ranges, max_size=20), lists(version_strategy(), max_size=5))
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_range_index_matches_scan(ranges, versions):
+    index = RangeIndex(ranges)
+
+    for version in versions:
+        expected = [i for i, r in enumerate(ranges) if scan_range(r, version)]
+        assert index.containing(version) == expected
+        assert [i for i, r in enumerate(ranges) if version in r] == expected
+
+
+@given(lists(version_strategy(), min_size=1, max_size=8))
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_range_index_bounds_from_versions(versions):
+    # Ranges whose bounds are the queried versions exercise equal keys.
+    ranges = [
+        VersionRange(a, b, include_lower, include_upper)
+        for a in versions
+        for b in versions
+        for include_lower in (True, False)
+        for include_upper in (True, False)
+    ]
+    index = RangeIndex(ranges)
+
+    for version in versions:
+        expected = [i for i, r in enumerate(ranges) if scan_range(r, version)]
+        assert index.containing(version) == expected
@@ -1,5 +1,6 @@
 import pickle
 
+import pretend
 import pytest
 from hypothesis import HealthCheck, assume, given, settings
 
@@ -601,6 +602,29 @@ def test_parse_diagnostics_accepts_string_and_combines_expected_at_same_index():
     assert error.expected == ("a release number", "a pre-release tag")
 
 
+def test_parse_diagnostics_computes_callable_expected_lazily():
+    diagnostics = _ParseDiagnostics()
+    expected = pretend.call_recorder(lambda: ("a release number",))
+
+    diagnostics.expect(1, expected)
+    assert expected.calls == []
+
+    error = diagnostics.error("1.")
+    assert error is not None
+    assert error.expected == ("a release number",)
+    assert expected.calls == [pretend.call()]
+
+
+def test_prefix_parse_does_not_compute_expected():
+    parser = Parser("1.2. and more")
+    parser.expected_after_release_separator = pretend.raiser(AssertionError)
+
+    version, end = parser.parse_prefix()
+
+    assert (str(version), end) == ("1.2", 3)
+    assert parser.diagnostics.index == 4
+
+
 def test_strict_expected_after_release_separator_omits_pre_release_tag():
     parser = Parser("1.", strict=True)
 
@@ -677,3 +701,25 @@ def test_strict_missing_separator_error_returns_none_for_unknown_tag():
 def test_strict_finish_raises_unexpected_input_when_no_specific_error_matches():
     with pytest.raises(UnexpectedInputError):
         Version.parse("1foo", strict=True)
+
+
+def test_parser_reuse():
+    parser = Parser(strict=True)
+
+    assert str(parser.parse("1.2")) == "1.2"
+    with pytest.raises(UnexpectedInputError):
+        parser.parse("1.2.")
+    assert str(parser.parse("1.2rc1")) == "1.2rc1"
+
+    parser.reset("2.0")
+    assert str(parser.parse()) == "2.0"
+
+
+def test_parser_validate():
+    parser = Parser(strict=True)
+
+    assert parser.validate("1.2") is None
+    with pytest.raises(LeadingZerosError):
+        parser.validate("1.02")
+    parser.reset("1.2+abc")
+    assert parser.validate() is None
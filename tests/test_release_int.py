@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from parver._release_int import ReleaseInt, intwidth
@@ -138,3 +140,88 @@ def test_release_int_invalid_type():
 def test_release_int_invalid_width(width, error_type, match):
     with pytest.raises(error_type, match=match):
         ReleaseInt(1, width=width)
+
+
+def test_release_int_is_immutable():
+    release = ReleaseInt("05")
+
+    with pytest.raises(AttributeError, match="immutable"):
+        release._minimum_width = 3
+    with pytest.raises(AttributeError, match="immutable"):
+        del release._minimum_width
+    assert release.minimum_width == 2
+
+
+def test_release_int_type_and_subclasses():
+    class Sub(ReleaseInt):
+        pass
+
+    assert type(ReleaseInt("05")) is ReleaseInt
+    assert type(ReleaseInt(5, width=40)) is ReleaseInt
+    assert type(Sub("05")) is Sub
+    assert Sub("05").minimum_width == 2
+    assert str(Sub(5, width=3)) == "005"
+
+
+@pytest.mark.parametrize(
+    ("make", "cached"),
+    [
+        (lambda: ReleaseInt("05"), True),
+        (lambda: ReleaseInt(5, width=2), True),
+        (lambda: ReleaseInt("05").zero_like(), True),
+        (lambda: ReleaseInt("04") + 1, True),
+        (lambda: ReleaseInt(5), False),
+        (lambda: ReleaseInt("5"), False),
+        (lambda: ReleaseInt(5, width=5), False),
+        (lambda: ReleaseInt("0005000"), False),
+        (lambda: ReleaseInt("-05"), False),
+    ],
+)
+def test_release_int_cache(make, cached):
+    assert (make() is make()) is cached
+
+
+@pytest.mark.parametrize("value", ["05", "-05", "0005000", "5"])
+def test_release_int_roundtrips_with_pickle(value):
+    release = ReleaseInt(value)
+
+    reloaded = pickle.loads(pickle.dumps(release))
+
+    assert isinstance(reloaded, ReleaseInt)
+    assert reloaded == release
+    assert reloaded.minimum_width == release.minimum_width
+    assert repr(reloaded) == repr(release)
+
+
+def test_release_int_width_override_smaller_than_value_roundtrips_with_pickle():
+    release = ReleaseInt(123, width=1)
+
+    reloaded = pickle.loads(pickle.dumps(release))
+
+    assert reloaded.minimum_width == 1
+    assert str(reloaded - 120) == "3"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        # ReleaseInt("05") pickled by parver 1.0 with protocols 0, 2, and 5.
+        b"ccopy_reg\n_reconstructor\np0\n(cparver._release_int\nReleaseInt\np1\n"
+        b"c__builtin__\nlong\np2\nI5\ntp3\nRp4\n(dp5\nV_minimum_width\np6\nI2\nsb.",
+        b"\x80\x02cparver._release_int\nReleaseInt\nq\x00K\x05\x85q\x01\x81q\x02}q"
+        b"\x03X\x0e\x00\x00\x00_minimum_widthq\x04K\x02sb.",
+        b"\x80\x05\x95C\x00\x00\x00\x00\x00\x00\x00\x8c\x13parver._release_int\x94"
+        b"\x8c\nReleaseInt\x94\x93\x94K\x05\x85\x94\x81\x94}\x94\x8c\x0e"
+        b"_minimum_width\x94K\x02sb.",
+    ],
+)
+def test_release_int_loads_legacy_pickle(data):
+    release = pickle.loads(data)
+
+    assert type(release) is ReleaseInt
+    assert release == 5
+    assert str(release) == "05"
+    assert repr(release) == "ReleaseInt('05')"
+    # The shared instance is not changed by loading the pickle.
+    assert str(ReleaseInt(5)) == "5"
+    assert ReleaseInt("05").minimum_width == 2
@@ -0,0 +1,70 @@
+import pytest
+
+from parver import Version, VersionMatch, find_versions
+from parver._version import Parser
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", []),
+        ("no versions here", []),
+        ("1.2", [("1.2", 0, 3)]),
+        ("Released 1.2.3.", [("1.2.3", 9, 14)]),
+        ("from v1.2-beta to 1.3", [("v1.2-beta", 5, 14), ("1.3", 18, 21)]),
+        (
+            "1!2.0rc1.post2.dev3+ubuntu.1 done",
+            [("1!2.0rc1.post2.dev3+ubuntu.1", 0, 28)],
+        ),
+        ("pkg-1.2.3-py3-none-any.whl", [("1.2.3", 4, 9)]),
+        # glued to a preceding word or number
+        ("py3 python3.11 x1.2", []),
+        # followed by a letter or digit
+        ("3rd 10am 1.2x", []),
+        # invalid trailing segments are left out
+        ("1.2+ 1.2+abc. 1!x", [("1.2", 0, 3), ("1.2+abc", 5, 12), ("1", 14, 15)]),
+        ("(1.0, 2.0)", [("1.0", 1, 4), ("2.0", 6, 9)]),
+    ],
+)
+def test_find_versions(text, expected):
+    matches = list(find_versions(text))
+
+    assert [(str(m.version), m.start, m.end) for m in matches] == expected
+    for match in matches:
+        assert text[match.start : match.end] == str(match.version)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("1.2 1.02 v1.3 1.4-a1 1.5a1", ["1.2", "1.5a1"]),
+        ("1+ABC 1+abc", ["1+abc"]),
+    ],
+)
+def test_find_versions_strict(text, expected):
+    assert [str(m.version) for m in find_versions(text, strict=True)] == expected
+
+
+def test_version_match_span():
+    match = VersionMatch(Version.parse("1.2"), 4, 7)
+
+    assert match.span == (4, 7)
+
+
+@pytest.mark.parametrize(
+    ("text", "start", "expected"),
+    [
+        ("1.2 and more", 0, ("1.2", 3)),
+        ("see 1.2a", 4, ("1.2a", 8)),
+        ("abc", 0, None),
+        ("1+", 0, ("1", 1)),
+    ],
+)
+def test_parse_prefix(text, start, expected):
+    result = Parser(text).parse_prefix(start)
+
+    if expected is None:
+        assert result is None
+    else:
+        version, end = result
+        assert (str(version), end) == expected
@@ -0,0 +1,206 @@
+from itertools import pairwise
+
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis.strategies import integers, lists
+
+from parver import (
+    LargestVersions,
+    Version,
+    latest_by,
+    merge_sorted,
+    nlargest,
+    nsmallest,
+)
+
+from .strategies import parse_all, version_strategy
+
+
+@given(lists(version_strategy()), integers(min_value=0, max_value=5))
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_nlargest_nsmallest_match_sorting(versions, k):
+    expected_largest = sorted(versions, key=lambda v: v.sort_key, reverse=True)[:k]
+    expected_smallest = sorted(versions, key=lambda v: v.sort_key)[:k]
+
+    largest = LargestVersions(k)
+    largest.update(versions)
+
+    # Compare by identity, since equal versions may be spelled differently.
+    assert list(map(id, nlargest(k, versions))) == list(map(id, expected_largest))
+    assert list(map(id, largest.result())) == list(map(id, expected_largest))
+    assert list(map(id, nsmallest(k, versions))) == list(map(id, expected_smallest))
+
+
+def test_nlargest_keeps_first_of_equal_versions():
+    versions = parse_all(["1.0.0", "1.0", "1", "0.9"])
+
+    assert list(map(str, nlargest(2, versions))) == ["1.0.0", "1.0"]
+    assert list(map(str, nsmallest(2, versions))) == ["0.9", "1.0.0"]
+
+    largest = LargestVersions(2)
+    largest.update(versions)
+    assert list(map(str, largest.result())) == ["1.0.0", "1.0"]
+
+
+def test_nlargest_include_prereleases():
+    versions = parse_all(["1.0", "2.0rc1", "2.0.dev0", "1.5.post1", "0.9"])
+
+    assert nlargest(2, versions, include_prereleases=False) == parse_all(
+        ["1.5.post1", "1.0"]
+    )
+    assert nsmallest(2, iter(versions), include_prereleases=False) == parse_all(
+        ["0.9", "1.0"]
+    )
+
+    largest = LargestVersions(2, include_prereleases=False)
+    largest.update(versions)
+    assert largest.result() == parse_all(["1.5.post1", "1.0"])
+
+
+def test_largest_versions():
+    largest = LargestVersions(2)
+    assert len(largest) == 0
+    assert largest.result() == []
+
+    largest.add(Version.parse("1.0"))
+    largest.add(Version.parse("0.5"))
+    largest.add(Version.parse("2.0"))
+
+    assert len(largest) == 2
+    assert repr(largest) == "<LargestVersions k=2 size=2>"
+    assert largest.result() == parse_all(["2.0", "1.0"])
+
+    empty = LargestVersions(0)
+    empty.add(Version.parse("1.0"))
+    assert empty.result() == []
+
+
+@pytest.mark.parametrize(
+    ("k", "exc", "match"),
+    [
+        (-1, ValueError, "k cannot be negative"),
+        (1.0, TypeError, "k must be an integer"),
+        (True, TypeError, "k must be an integer"),
+    ],
+)
+def test_k_error(k, exc, match):
+    with pytest.raises(exc, match=match):
+        nlargest(k, [])
+    with pytest.raises(exc, match=match):
+        nsmallest(k, [])
+    with pytest.raises(exc, match=match):
+        LargestVersions(k)
+
+
+def test_latest_by():
+    versions = parse_all(["1.2.0", "1.2.3", "1.2.4rc1", "1.3", "1.3.0.post1", "2"])
+
+    assert latest_by(versions) == {
+        (0, (1, 2)): Version.parse("1.2.3"),
+        (0, (1, 3)): Version.parse("1.3.0.post1"),
+        (0, (2, 0)): Version.parse("2"),
+    }
+    assert latest_by(versions, prefix_len=1) == {
+        (0, (1,)): Version.parse("1.3.0.post1"),
+        (0, (2,)): Version.parse("2"),
+    }
+
+
+def test_latest_by_include_prereleases():
+    versions = parse_all(["1.2.3", "1.2.4rc1", "1.3.dev0"])
+
+    assert latest_by(versions) == {(0, (1, 2)): Version.parse("1.2.3")}
+    assert latest_by(versions, include_prereleases=True) == {
+        (0, (1, 2)): Version.parse("1.2.4rc1"),
+        (0, (1, 3)): Version.parse("1.3.dev0"),
+    }
+
+
+def test_latest_by_epochs_and_trailing_zeros():
+    versions = parse_all(["1.0", "1", "1.0.0", "1!0.5", "0!1.0.1"])
+
+    result = latest_by(versions)
+
+    assert list(result) == [(0, (1, 0)), (1, (0, 5))]
+    # Equal versions keep the first one seen.
+    assert str(result[0, (1, 0)]) == "0!1.0.1"
+    assert str(latest_by(versions[:3])[0, (1, 0)]) == "1.0"
+
+
+def test_latest_by_consumes_iterator_once():
+    versions = iter(parse_all(["1.0", "1.1", "1.0.1"]))
+
+    assert latest_by(versions) == {
+        (0, (1, 0)): Version.parse("1.0.1"),
+        (0, (1, 1)): Version.parse("1.1"),
+    }
+
+
+@pytest.mark.parametrize(
+    ("prefix_len", "exc"),
+    [(0, ValueError), (-1, ValueError), (1.5, TypeError), (True, TypeError)],
+)
+def test_latest_by_prefix_len_error(prefix_len, exc):
+    with pytest.raises(exc, match="prefix_len"):
+        latest_by([], prefix_len=prefix_len)
+
+
+@given(lists(version_strategy()), integers(min_value=1, max_value=4))
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_latest_by_matches_sorting(versions, prefix_len):
+    expected = {}
+    for version in sorted(versions, reverse=True):
+        if version.is_prerelease:
+            continue
+        prefix = (*version.release, *(0,) * prefix_len)[:prefix_len]
+        expected.setdefault((version.epoch, prefix), version)
+
+    assert latest_by(versions, prefix_len=prefix_len) == expected
+
+
+@given(lists(lists(version_strategy()), max_size=4))
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_merge_sorted_matches_sorting(iterables):
+    iterables = [sorted(versions) for versions in iterables]
+    expected = sorted(v for versions in iterables for v in versions)
+
+    result = list(merge_sorted(*map(iter, iterables)))
+
+    assert list(map(id, result)) == list(map(id, expected))
+
+    deduped = list(merge_sorted(*iterables, dedupe=True))
+    assert all(a < b for a, b in pairwise(deduped))
+    assert set(deduped) == set(expected)
+
+
+def test_merge_sorted_dedupe_keeps_first():
+    a = parse_all(["1.0", "1.2", "2.0"])
+    b = parse_all(["1.0.0", "1.1", "2", "3"])
+
+    assert list(map(str, merge_sorted(a, b))) == [
+        "1.0",
+        "1.0.0",
+        "1.1",
+        "1.2",
+        "2.0",
+        "2",
+        "3",
+    ]
+    assert list(map(str, merge_sorted(b, a, dedupe=True))) == [
+        "1.0.0",
+        "1.1",
+        "1.2",
+        "2",
+        "3",
+    ]
+
+
+def test_merge_sorted_is_lazy():
+    def versions():
+        yield Version.parse("1")
+        pytest.fail("consumed too many versions")
+
+    merged = merge_sorted(versions(), parse_all(["2"]), dedupe=True)
+
+    assert next(merged) == Version.parse("1")
+    assert list(merge_sorted()) == []
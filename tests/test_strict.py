@@ -0,0 +1,206 @@
+import pytest
+from hypothesis import HealthCheck, given, settings
+
+from parver import (
+    InvalidLocalError,
+    LeadingZerosError,
+    NoLeadingNumberError,
+    ParseError,
+    RepairRule,
+    StrictPreTagError,
+    UnexpectedInputError,
+    Version,
+    VPrefixNotAllowedError,
+    check_strict,
+    repair,
+    repair_many,
+    validate_many,
+)
+
+from .strategies import version_string, whitespace
+
+
+def _is_strict(version):
+    try:
+        Version.parse(version, strict=True)
+    except ParseError:
+        return False
+    return True
+
+
+@given(whitespace, version_string(), whitespace)
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_check_strict_hypothesis(prefix, version, suffix):
+    text = prefix + version + suffix
+    check = check_strict(text)
+
+    assert check.text == text
+    assert str(check.version) == version
+    assert check.is_strict is _is_strict(text)
+    assert (check.strict_error is None) is check.is_strict
+
+
+@given(version_string(strict=True))
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_check_strict_hypothesis_strict(version):
+    assert check_strict(version).is_strict
+
+
+@pytest.mark.parametrize(
+    "version",
+    ["1", " 1.2 ", "0!1", "1!2.0rc1.post2.dev3+abc.1", "1+1abc"],
+)
+def test_check_strict_valid(version):
+    check = check_strict(version)
+
+    assert check.is_strict
+    assert check.strict_error is None
+    assert repr(check) == f"<StrictCheck {version!r} is_strict=True>"
+
+
+@pytest.mark.parametrize(
+    ("version", "error_type"),
+    [
+        ("v1", VPrefixNotAllowedError),
+        ("00!1", LeadingZerosError),
+        ("1.02", LeadingZerosError),
+        ("1.2alpha1", StrictPreTagError),
+        ("1.2c1", ParseError),
+        ("1.2-1", ParseError),
+        ("1.2.post", ParseError),
+        ("1+ABC", ParseError),
+        ("1+abc-1", ParseError),
+    ],
+)
+def test_check_strict_invalid(version, error_type):
+    check = check_strict(version)
+
+    assert not check.is_strict
+    assert isinstance(check.strict_error, error_type)
+    # computed once
+    assert check.strict_error is check.strict_error
+    with pytest.raises(error_type) as excinfo:
+        Version.parse(version, strict=True)
+    assert str(check.strict_error) == str(excinfo.value)
+
+
+def test_check_strict_parse_error():
+    with pytest.raises(ParseError):
+        check_strict("1.")
+
+
+def test_validate_many():
+    items = ["1.0", "1.02", "v1", "1.0+ABC", "1.0+01", "1.0alpha1", "x", "2"]
+
+    report = validate_many(items)
+
+    assert report.total == 8
+    assert report.valid == 2
+    assert not report.ok
+    assert [
+        (f.index, f.text, type(f.error), f.suggestion) for f in report.failures
+    ] == [
+        (1, "1.02", LeadingZerosError, "1.2"),
+        (2, "v1", VPrefixNotAllowedError, "1"),
+        (3, "1.0+ABC", InvalidLocalError, "1.0+abc"),
+        (4, "1.0+01", InvalidLocalError, "1.0+1"),
+        (5, "1.0alpha1", StrictPreTagError, "1.0a1"),
+        (6, "x", NoLeadingNumberError, None),
+    ]
+    assert report.counts == {
+        LeadingZerosError: 1,
+        VPrefixNotAllowedError: 1,
+        InvalidLocalError: 2,
+        StrictPreTagError: 1,
+        NoLeadingNumberError: 1,
+    }
+    for failure in report.failures:
+        with pytest.raises(type(failure.error)) as excinfo:
+            Version.parse(failure.text, strict=True)
+        assert str(excinfo.value) == str(failure.error)
+
+
+def test_validate_many_permissive():
+    report = validate_many(iter(["1.02", "v1", "1."]), strict=False)
+
+    assert report.total == 3
+    assert report.valid == 2
+    assert [(f.index, f.suggestion) for f in report.failures] == [(2, None)]
+    assert report.counts == {UnexpectedInputError: 1}
+
+
+def test_validate_many_empty():
+    report = validate_many([])
+
+    assert report.total == report.valid == 0
+    assert report.ok
+
+
+@given(whitespace, version_string(), whitespace)
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_repair_hypothesis(prefix, version, suffix):
+    text = prefix + version + suffix
+    result = repair(text)
+
+    assert result.text == text
+    assert result.version == Version.parse(text)
+    assert result.changed is not check_strict(text).is_strict
+    assert Version.parse(str(result.version), strict=True) == result.version
+
+
+@pytest.mark.parametrize(
+    ("version", "expected", "rules"),
+    [
+        ("1.0", "1.0", []),
+        (" 0!1.0+abc ", "0!1.0+abc", []),
+        ("V1", "1", [RepairRule.V_PREFIX]),
+        ("01!1", "1!1", [RepairRule.LEADING_ZEROS]),
+        ("1.0rc01", "1.0rc1", [RepairRule.LEADING_ZEROS]),
+        ("1.0RC1", "1.0rc1", [RepairRule.PRE_TAG]),
+        ("1.0-rc_1", "1.0rc1", [RepairRule.SEPARATOR]),
+        ("1.0rc", "1.0rc0", [RepairRule.IMPLICIT_NUMBER]),
+        ("1.0-1", "1.0.post1", [RepairRule.IMPLICIT_POST]),
+        ("1.0.rev1", "1.0.post1", [RepairRule.POST_TAG]),
+        ("1.0-post.1", "1.0.post1", [RepairRule.SEPARATOR]),
+        ("1.0.post", "1.0.post0", [RepairRule.IMPLICIT_NUMBER]),
+        ("1.0.DEV1", "1.0.dev1", [RepairRule.DEV_TAG]),
+        ("1.0dev1", "1.0.dev1", [RepairRule.SEPARATOR]),
+        ("1.0.dev-1", "1.0.dev1", [RepairRule.SEPARATOR]),
+        ("1.0.dev", "1.0.dev0", [RepairRule.IMPLICIT_NUMBER]),
+        ("1.0+ABC-01", "1.0+abc.1", [RepairRule.LOCAL]),
+        (
+            "v1.0-a.post_dev",
+            "1.0a0.post0.dev0",
+            [
+                RepairRule.V_PREFIX,
+                RepairRule.SEPARATOR,
+                RepairRule.IMPLICIT_NUMBER,
+            ],
+        ),
+    ],
+)
+def test_repair(version, expected, rules):
+    result = repair(version)
+
+    assert str(result.version) == expected
+    assert list(result.rules) == rules
+    assert result.changed is bool(rules)
+
+
+def test_repair_invalid():
+    with pytest.raises(ParseError):
+        repair("1.")
+
+
+def test_repair_many():
+    items = ["1.0", "v2", "x", "3.0alpha"]
+
+    with pytest.raises(ParseError):
+        list(repair_many(items))
+
+    results = list(repair_many(iter(items), skip_invalid=True))
+    assert [(r.text, str(r.version), r.changed) for r in results] == [
+        ("1.0", "1.0", False),
+        ("v2", "2", True),
+        ("3.0alpha", "3.0a0", True),
+    ]
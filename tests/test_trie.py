@@ -0,0 +1,108 @@
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis.strategies import integers, lists
+
+from parver import ReleaseTrie, Version
+
+from .strategies import parse_all, version_strategy
+
+
+def has_prefix(version, prefix, epoch):
+    padded = (*version.release, *(0,) * len(prefix))
+    return version.epoch == epoch and padded[: len(prefix)] == prefix
+
+
+def test_release_trie():
+    versions = parse_all(["1.1", "1.2", "1.2.1rc1", "1.2.1", "1.3", "2", "1!1.2"])
+    trie = ReleaseTrie(versions)
+
+    assert len(trie) == 7
+    assert repr(trie) == "<ReleaseTrie size=7>"
+    assert list(trie) == sorted(versions)
+    assert list(trie.with_prefix((1, 2))) == parse_all(["1.2", "1.2.1rc1", "1.2.1"])
+    assert list(trie.with_prefix(1, epoch=1)) == parse_all(["1!1.2"])
+    assert list(trie.with_prefix(())) == sorted(versions[:6])
+    assert list(trie.with_prefix((1, 4))) == []
+    assert list(trie.with_prefix(1, epoch=2)) == []
+
+
+def test_release_trie_trailing_zeros():
+    trie = ReleaseTrie(parse_all(["0", "1", "1.0.1", "1.0.0.0", "1.1", "2.0"]))
+
+    assert len(trie) == 5
+    assert list(map(str, trie.with_prefix((1, 0)))) == ["1", "1.0.1"]
+    assert list(map(str, trie.with_prefix((1, 0, 0)))) == ["1"]
+    assert list(map(str, trie.with_prefix((2, 0, 0, 0)))) == ["2.0"]
+    assert list(map(str, trie.with_prefix(0))) == ["0"]
+    assert list(map(str, trie.with_prefix((0, 0)))) == ["0"]
+
+
+def test_release_trie_is_a_set():
+    trie = ReleaseTrie()
+    trie.add(Version.parse("1.0"))
+    trie.add(Version.parse("1.0.0"))
+
+    assert len(trie) == 1
+    assert list(map(str, trie)) == ["1.0"]
+    assert Version.parse("1") in trie
+    assert Version.parse("1.0+local") not in trie
+    assert "1.0" not in trie
+
+
+def test_release_trie_remove():
+    versions = parse_all(["0", "1.2", "1.2.3", "1.2.3.4", "1!1"])
+    trie = ReleaseTrie(versions)
+
+    trie.remove(Version.parse("1.2.3.0"))
+    assert Version.parse("1.2.3") not in trie
+    assert list(trie.with_prefix((1, 2, 3))) == parse_all(["1.2.3.4"])
+
+    with pytest.raises(KeyError):
+        trie.remove(Version.parse("1.2.3"))
+    with pytest.raises(KeyError):
+        trie.remove(Version.parse("3"))
+    trie.discard(Version.parse("1.2.3"))
+
+    for version in versions:
+        trie.discard(version)
+
+    assert len(trie) == 0
+    assert list(trie) == []
+    assert trie._roots == {}
+
+
+@pytest.mark.parametrize(
+    ("release", "epoch", "exc"),
+    [
+        ((1, -1), 0, ValueError),
+        ((1, "2"), 0, TypeError),
+        (True, 0, TypeError),
+        ((1,), -1, ValueError),
+    ],
+)
+def test_with_prefix_error(release, epoch, exc):
+    trie = ReleaseTrie()
+    with pytest.raises(exc):
+        trie.with_prefix(release, epoch=epoch)
+
+
+@given(
+    lists(version_strategy()),
+    lists(integers(min_value=0, max_value=2), max_size=3),
+    integers(min_value=0, max_value=1),
+)
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_with_prefix_matches_scan(versions, prefix, epoch):
+    trie = ReleaseTrie(versions)
+    prefix = tuple(prefix)
+
+    unique = list(dict.fromkeys(versions))
+    expected = sorted(v for v in unique if has_prefix(v, prefix, epoch))
+
+    assert list(trie.with_prefix(prefix, epoch=epoch)) == expected
+    assert list(trie) == sorted(unique)
+    assert len(trie) == len(unique)
+
+    for version in versions:
+        trie.discard(version)
+    assert len(trie) == 0
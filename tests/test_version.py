@@ -1,12 +1,59 @@
+import bisect
+import gc
 import pickle
+import weakref
 
 import pytest
 from hypothesis import HealthCheck, given, settings
+from hypothesis.strategies import integers, lists
 
-from parver import Version
+from parver import ParseError, Version
 from parver._helpers import IMPLICIT_ZERO
-
-from .strategies import version_strategy
+from parver._version import _parse_local
+
+from .strategies import version_strategy, version_string
+
+# Versions pickled by parver 1.0 with protocol 2, which stored zero-padded
+# numbers in release as ReleaseInt instances with a __dict__.
+LEGACY_PICKLES = [
+    (
+        "1.0",
+        b"\x80\x02cparver\nVersion\nq\x00)\x81q\x01N}q\x02(X\x07\x00\x00\x00_froze"
+        b"nq\x03\x88X\x04\x00\x00\x00_keyq\x04(K\x00K\x01\x85q\x05cparver._helpers\n"
+        b"InfinityType\nq\x06)\x81q\x07cparver._helpers\nNega"
+        b"tiveInfinityType\nq\x08)\x81q\th\x07h\ttq\nX\x03\x00\x00\x00devq\x0b"
+        b"NX\x0c\x00\x00\x00dev_implicitq\x0c\x89X\x08\x00\x00\x00dev_sep1q\rNX\x08\x00"
+        b"\x00\x00dev_sep2q\x0eNX\x07\x00\x00\x00dev_tagq\x0fNX\x05\x00\x00\x00epochq\x10"
+        b"K\x00X\x0e\x00\x00\x00epoch_implicitq\x11\x88X\x05\x00\x00\x00localq\x12NX\x04\x00"
+        b"\x00\x00postq\x13NX\r\x00\x00\x00post_implicitq\x14\x89X\t\x00\x00\x00post_"
+        b"sep1q\x15NX\t\x00\x00\x00post_sep2q\x16NX\x08\x00\x00\x00post_tagq\x17N"
+        b"X\x03\x00\x00\x00preq\x18NX\x0c\x00\x00\x00pre_implicitq\x19\x89X\x08\x00\x00\x00pre_"
+        b"sep1q\x1aNX\x08\x00\x00\x00pre_sep2q\x1bNX\x07\x00\x00\x00pre_tagq\x1cNX\x07"
+        b"\x00\x00\x00releaseq\x1dK\x01cparver._release_int\nRelea"
+        b'seInt\nq\x1eK\x00\x85q\x1f\x81q }q!X\x0e\x00\x00\x00_minimum_widthq"'
+        b"K\x01sb\x86q#X\x01\x00\x00\x00vq$Nu\x86q%b.",
+    ),
+    (
+        "v2026.05.01rc1.post2+Local",
+        b"\x80\x02cparver\nVersion\nq\x00)\x81q\x01N}q\x02(X\x07\x00\x00\x00_froze"
+        b"nq\x03\x88X\x04\x00\x00\x00_keyq\x04(K\x00M\xea\x07cparver._release_in"
+        b"t\nReleaseInt\nq\x05K\x05\x85q\x06\x81q\x07}q\x08X\x0e\x00\x00\x00_minimum_"
+        b"widthq\tK\x02sbh\x05K\x01\x85q\n\x81q\x0b}q\x0ch\tK\x02sb\x87q\rX\x02\x00\x00\x00rc"
+        b"q\x0eK\x01\x86q\x0fK\x02cparver._helpers\nInfinityType\nq"
+        b"\x10)\x81q\x11cparver._helpers\nNegativeInfinityTy"
+        b"pe\nq\x12)\x81q\x13X\x05\x00\x00\x00localq\x14\x86q\x15\x85q\x16tq\x17X\x03\x00\x00\x00devq\x18"
+        b"NX\x0c\x00\x00\x00dev_implicitq\x19\x89X\x08\x00\x00\x00dev_sep1q\x1aNX\x08\x00"
+        b"\x00\x00dev_sep2q\x1bNX\x07\x00\x00\x00dev_tagq\x1cNX\x05\x00\x00\x00epochq\x1d"
+        b"K\x00X\x0e\x00\x00\x00epoch_implicitq\x1e\x88X\x05\x00\x00\x00localq\x1fX\x05\x00\x00"
+        b"\x00Localq X\x04\x00\x00\x00postq!K\x02X\r\x00\x00\x00post_implicitq"
+        b'"\x89X\t\x00\x00\x00post_sep1q#X\x01\x00\x00\x00.q$X\t\x00\x00\x00post_sep2'
+        b"q%NX\x08\x00\x00\x00post_tagq&X\x04\x00\x00\x00postq'X\x03\x00\x00\x00preq(K"
+        b"\x01X\x0c\x00\x00\x00pre_implicitq)\x89X\x08\x00\x00\x00pre_sep1q*NX\x08\x00"
+        b"\x00\x00pre_sep2q+NX\x07\x00\x00\x00pre_tagq,X\x02\x00\x00\x00rcq-X\x07\x00\x00"
+        b"\x00releaseq.M\xea\x07h\x07h\x0b\x87q/X\x01\x00\x00\x00vq0X\x01\x00\x00\x00vq1u\x86q2"
+        b"b.",
+    ),
+]
 
 
 def v(*args, **kwargs):
@@ -377,6 +424,23 @@ def test_version_is_immutable():
         del version.release
 
 
+@pytest.mark.parametrize(("text", "data"), LEGACY_PICKLES)
+def test_version_loads_legacy_pickle(text, data):
+    version = Version.parse(text)
+
+    reloaded = pickle.loads(data)
+
+    assert reloaded == version
+    assert str(reloaded) == text
+    assert reloaded.release == version.release
+    assert reloaded._release_widths == version._release_widths
+    assert hash(reloaded) == hash(version)
+    assert reloaded.is_release_candidate == version.is_release_candidate
+    assert str(reloaded.bump_release(index=2)) == str(version.bump_release(index=2))
+    with pytest.raises(AttributeError, match="immutable"):
+        reloaded.release = (2,)
+
+
 def test_version_roundtrips_with_pickle():
     version = Version.parse("v1.02.DEV3+LOCAL")
 
@@ -388,6 +452,208 @@ def test_version_roundtrips_with_pickle():
         reloaded.release = (2,)
 
 
+def test_intern_shares_instances_by_spelling():
+    a = Version.parse("1.0", intern=True)
+
+    assert Version.parse("1.0", intern=True) is a
+    assert Version.parse("1.0").intern() is a
+    assert Version.parse("1.0", strict=True, intern=True) is a
+    assert Version.parse("1.0.0", intern=True) is not a
+    assert Version.parse("1.0") is not a
+
+
+def test_intern_does_not_bypass_strict_parsing():
+    Version.parse("1.02", intern=True)
+
+    with pytest.raises(ParseError):
+        Version.parse("1.02", strict=True, intern=True)
+
+
+def test_intern_holds_versions_weakly():
+    version = Version.parse("1.2.3.4.5.6.7", intern=True)
+    ref = weakref.ref(version)
+    del version
+    gc.collect()
+
+    assert ref() is None
+
+
+@given(version_string())
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_intern_matches_parse(version):
+    expected = Version.parse(version)
+    Version.parse(version, intern=True)
+    interned = Version.parse(version, intern=True)
+
+    assert str(interned) == str(expected)
+    assert interned._attrs_as_init() == expected._attrs_as_init()
+
+
+def test_version_hash_is_cached_but_not_pickled():
+    version = Version.parse("1.0+local")
+    value = hash(version)
+
+    assert version._hash == value
+    assert hash(version) == value
+    assert pickle.loads(pickle.dumps(version))._hash is None
+
+
+@pytest.mark.parametrize(
+    ("a", "b"),
+    [
+        ("1.0", "1.0.0"),
+        ("1.0", "1.1"),
+        ("1.0+abc", "1.0+ABC"),
+    ],
+)
+def test_version_comparison_with_cached_hashes(a, b):
+    va, vb = Version.parse(a), Version.parse(b)
+    expected = va._key == vb._key
+    hash(va), hash(vb)
+
+    assert (va == vb) is expected
+    assert (va != vb) is not expected
+
+
+def test_version_compares_with_itself():
+    version = Version.parse("1.0")
+
+    assert version == version
+    assert version <= version
+    assert version >= version
+    assert not version != version
+    assert not version < version
+    assert not version > version
+
+
+@given(version_strategy(), version_strategy())
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_sort_key_matches_comparisons(a, b):
+    assert (a.sort_key < b.sort_key) is (a < b)
+    assert (a.sort_key == b.sort_key) is (a == b)
+    assert (a.sort_key > b.sort_key) is (a > b)
+
+
+@given(version_strategy(), version_strategy())
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_boundary_keys_match_comparisons(a, b):
+    assert (b.sort_key > a.successor_key()) is (b > a)
+    assert (a.successor_key() < b.sort_key) is (b > a)
+    assert (b.sort_key < a.successor_key()) is (b <= a)
+    assert (b.sort_key < a.predecessor_key()) is (b < a)
+    assert (a.predecessor_key() > b.sort_key) is (b < a)
+    assert (b.sort_key > a.predecessor_key()) is (b >= a)
+
+    assert (a.successor_key() < b.predecessor_key()) is (a < b)
+    assert (a.successor_key() == b.successor_key()) is (a == b)
+
+
+@pytest.mark.parametrize(
+    "version", ["1.0", "1.0.dev0", "1.0a1.post2.dev3", "1!2.0+abc.5", "0"]
+)
+def test_boundary_keys_sort_around_version(version):
+    v = Version.parse(version)
+    before, after = v.predecessor_key(), v.successor_key()
+
+    assert sorted([after, v.sort_key, before, v.sort_key]) == [
+        before,
+        v.sort_key,
+        v.sort_key,
+        after,
+    ]
+    assert v.sort_key != v.successor_key()
+    assert v.sort_key != v.predecessor_key()
+    assert v.predecessor_key() != v.successor_key()
+    assert len({v.successor_key(), v.successor_key(), v.predecessor_key()}) == 2
+    assert repr(v.successor_key()) == f"<after {v.sort_key!r}>"
+    assert repr(v.predecessor_key()) == f"<before {v.sort_key!r}>"
+
+
+def test_boundary_keys_range_scan():
+    keys = sorted(
+        Version.parse(v).sort_key
+        for v in ["1.0", "1.0.0+abc", "1.0.post1", "1.1.dev0", "1.1", "2.0rc1", "2"]
+    )
+    lower = Version.parse("1.0").successor_key()
+    upper = Version.parse("2.0").predecessor_key()
+
+    assert bisect.bisect_left(keys, lower) == 1
+    assert bisect.bisect_right(keys, upper) == 6
+
+    with pytest.raises(TypeError):
+        lower < 1
+
+
+@given(version_strategy())
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_stable_hash_depends_only_on_equality(version):
+    padded = version.replace(release=(*version._release_parts(), 0))
+
+    assert padded == version
+    assert padded.stable_hash() == version.stable_hash()
+    assert version.normalize().stable_hash() == version.stable_hash()
+
+
+@pytest.mark.parametrize(
+    ("a", "b"),
+    [
+        ("1.0", "1.0.0"),
+        ("0!1.0", "1"),
+        ("v1.0-ALPHA", "1.0a0"),
+        ("1.0+ABC-01", "1.0+abc.1"),
+    ],
+)
+def test_stable_hash_equal_versions(a, b):
+    assert Version.parse(a).stable_hash() == Version.parse(b).stable_hash()
+
+
+@pytest.mark.parametrize(
+    ("a", "b"),
+    [
+        ("1.0", "1.1"),
+        ("1!1.0", "1.0"),
+        ("1.0a1", "1.0b1"),
+        ("1.0", "1.0+abc"),
+    ],
+)
+def test_stable_hash_different_versions(a, b):
+    assert Version.parse(a).stable_hash() != Version.parse(b).stable_hash()
+
+
+@pytest.mark.parametrize(
+    ("bits", "expected"),
+    [
+        (64, 18292669324214657079),
+        (32, 2137811),
+        (8, 160),
+    ],
+)
+def test_stable_hash_value(bits, expected):
+    # Stable hashes may be persisted, so they must not change.
+    assert Version.parse("1.0").stable_hash(bits=bits) == expected
+
+
+@pytest.mark.parametrize("bits", [8, 16, 64, 128, 512])
+def test_stable_hash_bits(bits):
+    assert 0 <= Version.parse("1.0").stable_hash(bits=bits) < 2**bits
+
+
+@pytest.mark.parametrize(
+    ("bits", "exc"),
+    [
+        ("64", TypeError),
+        (64.0, TypeError),
+        (True, TypeError),
+        (0, ValueError),
+        (12, ValueError),
+        (520, ValueError),
+    ],
+)
+def test_stable_hash_bits_error(bits, exc):
+    with pytest.raises(exc):
+        Version.parse("1.0").stable_hash(bits=bits)
+
+
 @given(version_strategy())
 @settings(suppress_health_check=[HealthCheck.too_slow])
 def test_replace_roundtrip(version):
@@ -535,6 +801,42 @@ def test_parse_release_width_only_preserved_for_leading_zeros():
     assert type(plain_version.release[1]) is int
 
 
+@pytest.mark.parametrize(
+    ("version", "release"),
+    [
+        ("1.2", (1, 2)),
+        ("2026.05.09", (2026, 5, 9)),
+        ("1.0.00", (1, 0, 0)),
+    ],
+)
+def test_release_is_plain_ints(version, release):
+    v = Version.parse(version)
+
+    assert v.release == release
+    assert all(type(n) is int for n in v.release)
+    assert str(v) == version
+
+
+@pytest.mark.parametrize(
+    ("version", "widths"),
+    [
+        ("1.2", None),
+        ("1.0", None),
+        ("2026.05.09", (1, 2, 2)),
+        ("1.010", (1, 3)),
+    ],
+)
+def test_release_widths(version, widths):
+    assert Version.parse(version)._release_widths == widths
+
+
+def test_release_widths_survive_replace_and_truncate():
+    v = Version.parse("2026.05.00")
+
+    assert str(v.replace(pre_tag="rc", pre=1)) == "2026.05.00rc1"
+    assert str(v.truncate(min_length=2)) == "2026.05"
+
+
 @pytest.mark.parametrize(
     ("before", "index", "width", "after"),
     [
@@ -857,6 +1159,22 @@ def test_is_release_candidate(version):
     assert v.is_release_candidate
 
 
+def test_pre_tag_predicates_follow_replace_and_pickle():
+    v = Version.parse("1.0alpha1")
+    assert v.is_alpha
+
+    v = v.replace(pre_tag="PREVIEW")
+    assert v.is_release_candidate
+    assert not v.is_alpha
+    assert v == Version.parse("1.0rc1")
+
+    v = pickle.loads(pickle.dumps(v))
+    assert v.is_release_candidate
+    assert str(v.normalize()) == "1.0rc1"
+
+    assert not v.replace(pre=None, pre_tag=None).is_release_candidate
+
+
 def test_ambiguous():
     with pytest.raises(ValueError, match=r"post_tag.*pre"):
         Version(release=1, pre="", pre_tag="rc", post=2, post_tag=None)
@@ -893,5 +1211,109 @@ def test_truncate_error():
         Version.parse("1").truncate(min_length=0)
 
 
+@pytest.mark.parametrize(
+    ("before", "changes"),
+    [
+        (
+            "1.2.post1+local",
+            [
+                ("bump_release", (), dict(index=1)),
+                ("bump_pre", ("rc",), {}),
+                ("bump_dev", (), {}),
+                ("replace", (), dict(local=None)),
+            ],
+        ),
+        (
+            "2026.04.09",
+            [
+                ("bump_release_to", (), dict(index=1, value=5)),
+                ("set_release", (), dict(index=3, value=1)),
+                ("truncate", (), {}),
+            ],
+        ),
+        (
+            "1a",
+            [
+                ("bump_pre", (), {}),
+                ("bump_post", (None,), dict(by=2)),
+                ("bump_epoch", (), dict(width=2)),
+            ],
+        ),
+        (
+            "1.post2.dev",
+            [
+                ("replace", (), dict(post=None)),
+                ("bump_post", (), {}),
+                ("bump_dev", ("DEV",), dict(by=3)),
+                ("replace", (), dict(post_tag=None)),
+            ],
+        ),
+    ],
+)
+def test_evolve_matches_version_methods(before, changes):
+    expected = Version.parse(before)
+    builder = expected.evolve()
+    for name, args, kwargs in changes:
+        expected = getattr(expected, name)(*args, **kwargs)
+        assert getattr(builder, name)(*args, **kwargs) is builder
+
+    assert str(builder.build()) == str(expected)
+
+
+def test_evolve_validates_on_build():
+    builder = Version.parse("1.0").evolve()
+    builder.replace(pre_tag="a").bump_release(index=0)
+
+    with pytest.raises(ValueError, match="Must set pre if pre_tag is given"):
+        builder.build()
+
+    assert str(builder.replace(pre=1).build()) == "2.0a1"
+
+
+def test_evolve_does_not_change_version():
+    version = Version.parse("1.0")
+    builder = version.evolve().bump_release(index=0)
+
+    assert str(builder.build()) == "2.0"
+    assert str(builder.bump_release(index=0).build()) == "3.0"
+    assert str(version) == "1.0"
+
+
+def test_evolve_consumes_release_iterator_once():
+    builder = Version.parse("1").evolve().replace(release=iter([1, 2]))
+
+    assert str(builder.bump_release(index=1).build()) == "1.3"
+
+
+@given(lists(integers(min_value=0), min_size=1, max_size=8).map(tuple))
+def test_from_tuple(release):
+    version = Version.from_tuple(release)
+    expected = Version(release=release)
+
+    for name in Version.__slots__:
+        if name != "__weakref__":
+            assert getattr(version, name) == getattr(expected, name), name
+    assert version == expected
+    assert str(version) == str(expected)
+
+
+def test_from_tuple_is_immutable():
+    version = Version.from_tuple((1, 2))
+
+    with pytest.raises(AttributeError, match="immutable"):
+        version.release = (2,)
+
+
+def test_local_parsing_is_cached():
+    _parse_local.cache_clear()
+
+    Version.parse("1.0+Ubuntu-1").normalize()
+    Version.parse("2.0+Ubuntu-1").normalize()
+
+    info = _parse_local.cache_info()
+    assert info.misses == 2  # "Ubuntu-1" and "ubuntu.1"
+    assert info.hits == 4
+
+
 def test_public_module():
     assert Version.__module__ == "parver"